@@ -1,12 +1,14 @@
 from dataclasses import dataclass, field
-from typing import List, Any, Optional, Union, Tuple, ClassVar
+from typing import List, Any, Optional, Union, Tuple, ClassVar, Callable
 from enum import Enum
 from llvmlite import ir
 from pathlib import Path
 import os
 
 # Base classes first
-@dataclass
+# Every node is a slotted dataclass: no per-instance __dict__, so nodes are
+# smaller and faster to build, and only declared fields can be assigned
+@dataclass(slots=True)
 class ASTNode:
     """Base class for all AST nodes"""
     def codegen(self, builder: ir.IRBuilder, module: ir.Module) -> Any:
@@ -53,7 +55,7 @@ class Operator(Enum):
     DECREMENT = "--"
 
 # Literal values (no dependencies)
-@dataclass
+@dataclass(slots=True)
 class Literal(ASTNode):
     value: Any
     type: DataType
@@ -114,7 +116,7 @@ class Literal(ASTNode):
                     return ir.Constant(llvm_type, float(self.value))
             raise ValueError(f"Unsupported literal type: {self.type}")
 
-@dataclass
+@dataclass(slots=True)
 class Identifier(ASTNode):
     name: str
 
@@ -138,7 +140,7 @@ class Identifier(ASTNode):
         raise NameError(f"Unknown identifier: {self.name}")
 
 # Type definitions
-@dataclass
+@dataclass(slots=True)
 class TypeSpec(ASTNode):
     base_type: DataType
     is_signed: bool = True
@@ -203,17 +205,17 @@ class TypeSpec(ASTNode):
         else:
             return base_type
 
-@dataclass
+@dataclass(slots=True)
 class CustomType(ASTNode):
     name: str
     type_spec: TypeSpec
 
 # Expressions (built up from simple to complex)
-@dataclass
+@dataclass(slots=True)
 class Expression(ASTNode):
     pass
 
-@dataclass
+@dataclass(slots=True)
 class QualifiedName(Expression):
     """Represents qualified names with super:: or virtual:: or super::virtual:: for objects or structs"""
     qualifiers: List[str]
@@ -225,7 +227,7 @@ class QualifiedName(Expression):
             return f"{qual_str}.{self.member}"
         return qual_str
 
-@dataclass
+@dataclass(slots=True)
 class BinaryOp(Expression):
     left: Expression
     operator: Operator
@@ -308,7 +310,7 @@ class BinaryOp(Expression):
         else:
             raise ValueError(f"Unsupported operator: {self.operator}")
 
-@dataclass
+@dataclass(slots=True)
 class UnaryOp(Expression):
     operator: Operator
     operand: Expression
@@ -338,12 +340,12 @@ class UnaryOp(Expression):
         else:
             raise ValueError(f"Unsupported unary operator: {self.operator}")
 
-@dataclass
+@dataclass(slots=True)
 class CastExpression(Expression):
     target_type: TypeSpec
     expression: Expression
 
-@dataclass
+@dataclass(slots=True)
 class FunctionCall(Expression):
     name: str
     arguments: List[Expression] = field(default_factory=list)
@@ -358,7 +360,7 @@ class FunctionCall(Expression):
         arg_vals = [arg.codegen(builder, module) for arg in self.arguments]
         return builder.call(func, arg_vals)
 
-@dataclass
+@dataclass(slots=True)
 class MemberAccess(Expression):
     object: Expression
     member: str
@@ -401,7 +403,7 @@ class MemberAccess(Expression):
         
         raise ValueError(f"Member access on unsupported type: {obj_val.type}")
 
-@dataclass
+@dataclass(slots=True)
 class ArrayAccess(Expression):
     array: Expression
     index: Expression
@@ -425,24 +427,24 @@ class ArrayAccess(Expression):
         else:
             raise ValueError(f"Cannot access array element for type: {array_val.type}")
 
-@dataclass
+@dataclass(slots=True)
 class PointerDeref(Expression):
     pointer: Expression
 
-@dataclass
+@dataclass(slots=True)
 class AddressOf(Expression):
     expression: Expression
 
-@dataclass
+@dataclass(slots=True)
 class AlignOf(Expression):
 	target: Union[TypeSpec, Expression]
 
-@dataclass
+@dataclass(slots=True)
 class SizeOf(Expression):
 	target: Union[TypeSpec, Expression]
 
 # Variable declarations
-@dataclass
+@dataclass(slots=True)
 class VariableDeclaration(ASTNode):
     name: str
     type_spec: TypeSpec
@@ -535,7 +537,7 @@ class VariableDeclaration(ASTNode):
             raise ValueError(f"Unsupported type: {self.type_spec.base_type}")
 
 # Type declarations
-@dataclass
+@dataclass(slots=True)
 class TypeDeclaration(Expression):
     """AST node for type declarations using AS keyword"""
     name: str
@@ -587,23 +589,23 @@ class TypeDeclaration(Expression):
             raise ValueError(f"Unsupported type: {type_spec.base_type}")
 
 # Statements
-@dataclass
+@dataclass(slots=True)
 class Statement(ASTNode):
     pass
 
-@dataclass
+@dataclass(slots=True)
 class ExpressionStatement(Statement):
     expression: Expression
 
     def codegen(self, builder: ir.IRBuilder, module: ir.Module) -> ir.Value:
         return self.expression.codegen(builder, module)
 
-@dataclass
+@dataclass(slots=True)
 class Assignment(Statement):
     target: Expression
     value: Expression
 
-@dataclass
+@dataclass(slots=True)
 class Block(Statement):
     statements: List[Statement] = field(default_factory=list)
 
@@ -613,11 +615,11 @@ class Block(Statement):
             result = stmt.codegen(builder, module)
         return result
 
-@dataclass
+@dataclass(slots=True)
 class XorStatement(Statement):
     expressions: List[Expression] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class IfStatement(Statement):
     condition: Expression
     then_block: Block
@@ -651,7 +653,7 @@ class IfStatement(Statement):
         builder.position_at_start(merge_block)
         return None
 
-@dataclass
+@dataclass(slots=True)
 class WhileLoop(Statement):
     condition: Expression
     body: Block
@@ -689,25 +691,25 @@ class WhileLoop(Statement):
         builder.position_at_start(end_block)
         return None
 
-@dataclass
+@dataclass(slots=True)
 class DoWhileLoop(Statement):
     body: Block
     condition: Expression
 
-@dataclass
+@dataclass(slots=True)
 class ForLoop(Statement):
     init: Optional[Statement]
     condition: Optional[Expression]
     update: Optional[Statement]
     body: Block
 
-@dataclass
+@dataclass(slots=True)
 class ForInLoop(Statement):
     variables: List[str]
     iterable: Expression
     body: Block
 
-@dataclass
+@dataclass(slots=True)
 class ReturnStatement(Statement):
     value: Optional[Expression] = None
 
@@ -722,52 +724,52 @@ class ReturnStatement(Statement):
             builder.ret_void()
         return None
 
-@dataclass
+@dataclass(slots=True)
 class BreakStatement(Statement):
     pass
 
-@dataclass
+@dataclass(slots=True)
 class ContinueStatement(Statement):
     pass
 
-@dataclass
+@dataclass(slots=True)
 class Case(ASTNode):
     value: Optional[Expression]  # None for default case
     body: Block
 
-@dataclass
+@dataclass(slots=True)
 class SwitchStatement(Statement):
     expression: Expression
     cases: List[Case] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class TryBlock(Statement):
     try_body: Block
     catch_blocks: List[tuple] = field(default_factory=list)  # (exception_type, exception_name, body) tuples
 
-@dataclass
+@dataclass(slots=True)
 class ThrowStatement(Statement):
     expression: Expression
 
-@dataclass
+@dataclass(slots=True)
 class AssertStatement(Statement):
     condition: Expression
     message: Optional[str] = None
 
 # Function parameter
-@dataclass
+@dataclass(slots=True)
 class Parameter(ASTNode):
     name: str
     type_spec: TypeSpec
 
-@dataclass
+@dataclass(slots=True)
 class InlineAsm(Expression):
     """Represents inline assembly block"""
     body: str  # The raw assembly code
     is_volatile: bool = False  # New flag for volatile assembly
 
 # Function definition
-@dataclass
+@dataclass(slots=True)
 class FunctionDef(ASTNode):
     name: str
     parameters: List[Parameter]
@@ -776,6 +778,7 @@ class FunctionDef(ASTNode):
     is_const: bool = False
     is_volatile: bool = False
     is_prototype: bool = False
+    is_private: bool = False
 
     def codegen(self, builder: ir.IRBuilder, module: ir.Module) -> ir.Function:
         # Convert return type
@@ -841,7 +844,7 @@ class FunctionDef(ASTNode):
         else:
             raise ValueError(f"Unsupported type: {type_spec.base_type}")
 
-@dataclass
+@dataclass(slots=True)
 class DestructuringAssignment(Statement):
     """Destructuring assignment"""
     variables: List[Union[str, Tuple[str, TypeSpec]]]  # Can be simple names or (name, type) pairs
@@ -849,13 +852,13 @@ class DestructuringAssignment(Statement):
     source_type: Optional[Identifier]  # For the "from" clause
     is_explicit: bool  # True if using "as" syntax
 
-@dataclass
+@dataclass(slots=True)
 class UnionMember(ASTNode):
     name: str
     type_spec: TypeSpec
     initial_value: Optional[Expression] = None
 
-@dataclass
+@dataclass(slots=True)
 class UnionDef(ASTNode):
     name: str
     members: List[UnionMember] = field(default_factory=list)
@@ -910,7 +913,7 @@ class UnionDef(ASTNode):
         return union_type
 
 # Struct member
-@dataclass
+@dataclass(slots=True)
 class StructMember(ASTNode):
     name: str
     type_spec: TypeSpec
@@ -918,12 +921,13 @@ class StructMember(ASTNode):
     is_private: bool = False
 
 # Struct definition
-@dataclass
+@dataclass(slots=True)
 class StructDef(ASTNode):
     name: str
     members: List[StructMember] = field(default_factory=list)
     base_structs: List[str] = field(default_factory=list)  # inheritance
     nested_structs: List['StructDef'] = field(default_factory=list)
+    is_private: bool = False
 
     def codegen(self, builder: ir.IRBuilder, module: ir.Module) -> ir.Type:
         # Convert member types
@@ -985,7 +989,7 @@ class StructDef(ASTNode):
             raise ValueError(f"Unsupported type: {type_spec.base_type}")
 
 # Object method
-@dataclass
+@dataclass(slots=True)
 class ObjectMethod(ASTNode):
     name: str
     parameters: List[Parameter]
@@ -996,7 +1000,7 @@ class ObjectMethod(ASTNode):
     is_volatile: bool = False
 
 # Object definition
-@dataclass
+@dataclass(slots=True)
 class ObjectDef(ASTNode):
     name: str
     methods: List[ObjectMethod] = field(default_factory=list)
@@ -1008,6 +1012,7 @@ class ObjectDef(ASTNode):
     virtual_calls: List[Tuple[str, str, List[Expression]]] = field(default_factory=list)
     virtual_instances: List[Tuple[str, str, List[Expression]]] = field(default_factory=list)
     is_prototype: bool = False
+    is_private: bool = False
 
     def codegen(self, builder: ir.IRBuilder, module: ir.Module) -> ir.Type:
         # First create a struct type for the object's data members
@@ -1121,7 +1126,7 @@ class ObjectDef(ASTNode):
             raise ValueError(f"Unsupported type: {type_spec.base_type}")
 
 # Namespace definition
-@dataclass
+@dataclass(slots=True)
 class NamespaceDef(ASTNode):
     name: str
     functions: List[FunctionDef] = field(default_factory=list)
@@ -1187,7 +1192,7 @@ class NamespaceDef(ASTNode):
         return None
 
 # Import statement
-@dataclass
+@dataclass(slots=True)
 class UsingStatement(Statement):
     namespace_path: str  # e.g., "standard::io"
     
@@ -1198,10 +1203,12 @@ class UsingStatement(Statement):
             module._using_namespaces = []
         module._using_namespaces.append(self.namespace_path)
 
-@dataclass
+@dataclass(slots=True)
 class ImportStatement(Statement):
     module_name: str
     _processed_imports: ClassVar[dict] = {}
+    # Installed by the compiler driver so imported files go through its AST cache
+    _ast_loader: ClassVar[Optional[Callable[[Path], Any]]] = None
 
     def codegen(self, builder: ir.IRBuilder, module: ir.Module) -> None:
         """
@@ -1220,16 +1227,7 @@ class ImportStatement(Statement):
         self._processed_imports[str(resolved_path)] = None
 
         try:
-            with open(resolved_path, 'r', encoding='utf-8') as f:
-                source = f.read()
-
-            # Create fresh parser/lexer instances
-            from flexer import FluxLexer
-            tokens = FluxLexer(source).tokenize()
-            
-            # Get parser class without circular import
-            parser_class = self._get_parser_class()
-            imported_ast = parser_class(tokens).parse()
+            imported_ast = self._load_ast(resolved_path)
 
             # Create a new builder for the imported file
             import_builder = ir.IRBuilder()
@@ -1256,6 +1254,22 @@ class ImportStatement(Statement):
                 del self._processed_imports[str(resolved_path)]
             raise
 
+    def _load_ast(self, path: Path):
+        """Lex and parse an imported file, or hand it to the installed AST loader"""
+        if ImportStatement._ast_loader is not None:
+            return ImportStatement._ast_loader(path)
+
+        with open(path, 'r', encoding='utf-8') as f:
+            source = f.read()
+
+        # Create fresh parser/lexer instances
+        from flexer import FluxLexer
+        tokens = FluxLexer(source).tokenize()
+        
+        # Get parser class without circular import
+        parser_class = self._get_parser_class()
+        return parser_class(tokens).parse()
+
     def _get_parser_class(self):
         """Dynamically imports the parser class to avoid circular imports"""
         import fparser
@@ -1287,13 +1301,13 @@ class ImportStatement(Statement):
             raise ImportError(f"Invalid path resolution for {module_name}: {str(e)}")
 
 # Custom type definition
-@dataclass
+@dataclass(slots=True)
 class CustomTypeStatement(Statement):
     name: str
     type_spec: TypeSpec
 
 # Function definition statement
-@dataclass
+@dataclass(slots=True)
 class FunctionDefStatement(Statement):
     function_def: FunctionDef
 
@@ -1302,7 +1316,7 @@ class FunctionDefStatement(Statement):
         return self.function_def.codegen(builder, module)
 
 # Struct definition statement
-@dataclass
+@dataclass(slots=True)
 class StructDefStatement(Statement):
     struct_def: StructDef
 
@@ -1311,7 +1325,7 @@ class StructDefStatement(Statement):
         return self.struct_def.codegen(builder, module)
 
 # Object definition statement
-@dataclass
+@dataclass(slots=True)
 class ObjectDefStatement(Statement):
     object_def: ObjectDef
 
@@ -1319,7 +1333,7 @@ class ObjectDefStatement(Statement):
         return self.object_def.codegen(builder, module)
 
 # Namespace definition statement
-@dataclass
+@dataclass(slots=True)
 class NamespaceDefStatement(Statement):
     namespace_def: NamespaceDef
 
@@ -1327,7 +1341,7 @@ class NamespaceDefStatement(Statement):
         return self.namespace_def.codegen(builder, module)
 
 # Program root
-@dataclass
+@dataclass(slots=True)
 class Program(ASTNode):
     statements: List[Statement] = field(default_factory=list)
 
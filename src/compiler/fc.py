@@ -4,17 +4,47 @@ Flux Compiler with Full Toolchain Integration
 
 import sys
 import os
+import time
+import argparse
+import hashlib
+import pickle
+import shutil
 import subprocess
 from pathlib import Path
 from llvmlite import ir
-from flexer import FluxLexer
+from flexer import FluxLexer, TokenType
 from fparser import FluxParser, ParseError
 from fast import *
 
+# Frontend modules whose contents invalidate cached ASTs when they change
+FRONTEND_SOURCES = ("flexer.py", "fparser.py", "fast.py")
+# Every edit leaves a new entry in ~/.flux_cache; past this total size the least
+# recently used entries are deleted
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Each nesting level of the source costs a chain of Python frames while parsing and
+# generating code (a parenthesised expression alone is ~15 deep), so the interpreter
+# default of 1000 is too low; main() raises it for the compiler process only
+RECURSION_LIMIT = 20000
+
+def file_mtime(path: Path) -> Optional[int]:
+    """Modification time of a file in nanoseconds, or None if it cannot be read"""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
 class FluxCompiler:
-    def __init__(self, /, verbosity: int = None):
+    def __init__(self, /, verbosity: int = None, use_cache: bool = True,
+                 opt_level: int = 3, cpu: str = "generic"):
         self.verbosity = int(verbosity) if verbosity != None else None
-        self.module = ir.Module(name="flux_module")
+        self.opt_level = int(opt_level)
+        self.cpu = cpu
+        self.cache_dir = Path.home() / ".flux_cache" if use_cache else None
+        self.frontend_digest = None
+        # One LLVM context for the lifetime of the compiler; every module
+        # built by compile_file shares its type tables
+        self.context = ir.Context()
         import platform
         if platform.system() == "Darwin":  # macOS
             # Detect macOS architecture
@@ -22,39 +52,39 @@ class FluxCompiler:
             try:
                 arch = subprocess.check_output(["uname", "-m"], text=True).strip()
                 if arch == "arm64":
-                    self.module.triple = "arm64-apple-macosx11.0.0"
+                    self.triple = "arm64-apple-macosx11.0.0"
                 else:
-                    self.module.triple = "x86_64-apple-macosx10.15.0"
+                    self.triple = "x86_64-apple-macosx10.15.0"
             except:
-                self.module.triple = "arm64-apple-macosx11.0.0"  # Default to ARM64
+                self.triple = "arm64-apple-macosx11.0.0"  # Default to ARM64
         else:  # Linux and others
-            self.module.triple = "x86_64-pc-linux-gnu"
-        #self.module.data_layout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+            self.triple = "x86_64-pc-linux-gnu"
+        self.module = self.new_module()
         self.temp_files = []
+        # Files pulled in by import statements during the last compile_file,
+        # mapped to their mtime when they were read
+        self.imported_files = {}
+
+    def new_module(self) -> ir.Module:
+        """Create an empty module bound to the compiler's shared context"""
+        module = ir.Module(name="flux_module", context=self.context)
+        module.triple = self.triple
+        #module.data_layout = "e-m:e-p270:32:32-p271:32:32-p272:64:64-i64:64-f80:128-n8:16:32:64-S128"
+        return module
 
     def compile_file(self, filename: str, output_bin: str = None) -> str:
+        self.imported_files = {}
         try:
             # 1. Parse and generate LLVM IR
-            with open(filename, 'r') as f:
-                source = f.read()
-            
-            lexer = FluxLexer(source)
-            tokens = lexer.tokenize()
+            ast = self.load_ast(filename)
 
-            if self.verbosity == 0:
-                print(tokens)
-            
-            parser = FluxParser(tokens)
-            ast = parser.parse()
-
-            if self.verbosity == 1:
+            if self.verbosity in (1, 4):
                 print(ast)
             
-            print(ast)
-            self.module = ast.codegen(self.module)
+            self.module = self.generate_module(ast)
             llvm_ir = str(self.module)
 
-            if self.verbosity == 2:
+            if self.verbosity in (2, 4):
                 print(llvm_ir)
             
             # Create temp directory
@@ -64,8 +94,7 @@ class FluxCompiler:
             
             # 2. Generate LLVM IR file
             ll_file = temp_dir / f"{base_name}.ll"
-            with open(ll_file, 'w') as f:
-                f.write(llvm_ir)
+            self.write_file(ll_file, llvm_ir.encode('utf-8'))
             self.temp_files.append(ll_file)
             
             # 3. Compile directly to object file (skip assembly step on macOS)
@@ -73,41 +102,33 @@ class FluxCompiler:
             import platform
             if platform.system() == "Darwin":  # macOS
                 # Compile directly to object file to avoid assembly issues
-                subprocess.run([
+                self.run_tool([
                     "llc",
-                    "-O2",               # Enable optimizations  
+                    f"-O{self.opt_level}",   # Enable optimizations
+                    f"-mcpu={self.cpu}",     # Tune for and use the features of the target CPU
                     "-filetype=obj",     # Output object file directly
                     str(ll_file),
                     "-o", str(obj_file)
-                ], check=True)
+                ])
             else:  # Linux - use traditional assembly step
                 asm_file = temp_dir / f"{base_name}.s"
-                subprocess.run([
+                self.run_tool([
                     "llc",
-                    "-O2",               # Enable optimizations
+                    f"-O{self.opt_level}",   # Enable optimizations
+                    f"-mcpu={self.cpu}",     # Tune for and use the features of the target CPU
                     str(ll_file),
                     "-o", str(asm_file)
-                ], check=True)
+                ])
                 self.temp_files.append(asm_file)
 
-                if self.verbosity == 3:
-                    with open(asm_file, "r") as f:
-                        f.seek(0)
-                        print(f.read())
+                if self.verbosity in (3, 4):
+                    print(asm_file.read_text())
                 
-                subprocess.run([
+                self.run_tool([
                     "as", "--64", str(asm_file), "-o", str(obj_file)
-                ], check=True)
+                ])
             
             self.temp_files.append(obj_file)
-
-            if self.verbosity == 4:
-                print(tokens)
-                print(ast)
-                print(llvm_ir)
-                with open(asm_file, "r") as f:
-                    f.seek(0)
-                    print(f.read())
             
             # 5. Link executable
             output_bin = output_bin or f"./{base_name}"
@@ -115,9 +136,9 @@ class FluxCompiler:
             
             if platform.system() == "Darwin":  # macOS
                 # Use clang for linking on macOS
-                subprocess.run(["clang"] + link_args, check=True)
+                self.run_tool(["clang"] + link_args)
             else:  # Linux
-                subprocess.run(["gcc", "-no-pie"] + link_args, check=True)
+                self.run_tool(["gcc", "-no-pie"] + link_args)
             
             print(f"Successfully built: {output_bin}")
             return output_bin
@@ -127,6 +148,161 @@ class FluxCompiler:
             print(f"Compilation failed: {e}", file=sys.stderr)
             sys.exit(1)
     
+    def generate_module(self, ast: Program) -> ir.Module:
+        """Generate a fresh LLVM module for a program, with its imports loaded by this compiler"""
+        # ImportStatement's import table and AST loader are class-wide, so install
+        # this build's for the duration of codegen only and then put back whatever
+        # another user of fast had there
+        saved_imports = ImportStatement._processed_imports
+        saved_loader = ImportStatement._ast_loader
+        # Imports are tracked per module, and every compile starts a new one
+        ImportStatement._processed_imports = {}
+        # Imported files share the AST cache; only the main file's tokens are shown
+        ImportStatement._ast_loader = self.load_import
+        try:
+            return ast.codegen(self.new_module())
+        finally:
+            ImportStatement._processed_imports = saved_imports
+            ImportStatement._ast_loader = saved_loader
+    
+    def load_ast(self, filename: str, show_tokens: bool = True) -> Program:
+        """Lex and parse a source file, reusing the cached AST if the source is unchanged"""
+        source = Path(filename).read_bytes()
+        cached = None
+        show_tokens = show_tokens and self.verbosity in (0, 4)
+        # Tokens are only available from a real lex, so dumping them bypasses the cache
+        if self.cache_dir is not None and not show_tokens:
+            key = hashlib.blake2b(source, digest_size=16, key=self.get_frontend_digest()).hexdigest()
+            cached = self.cache_dir / f"{key}.ast.pkl"
+            try:
+                ast = pickle.loads(cached.read_bytes())
+            except Exception:
+                # Missing, truncated, corrupt or stale: any failure to unpickle
+                # is a cache miss and the file is parsed again
+                pass
+            else:
+                # Mark the entry as recently used so pruning keeps it
+                try:
+                    os.utime(cached)
+                except OSError:
+                    pass
+                return ast
+        
+        tokens = FluxLexer(source.decode()).tokenize()
+
+        if show_tokens:
+            print(tokens)
+        
+        parser = FluxParser(tokens)
+        ast = parser.parse()
+
+        # Never cache a partial AST, the parse errors would not be reported again
+        if cached is not None and not parser.errors:
+            try:
+                self.store_cached_ast(cached, ast)
+            except (OSError, RecursionError, pickle.PicklingError):
+                # The cache is only an optimisation: an AST too deep to pickle
+                # (or an unwritable cache directory) just goes uncached
+                pass
+        return ast
+    
+    def store_cached_ast(self, cached: Path, ast: Program) -> None:
+        """Write a cache entry atomically, then prune the cache back under CACHE_MAX_BYTES"""
+        data = pickle.dumps(ast, protocol=5)
+        self.cache_dir.mkdir(exist_ok=True)
+        # A concurrent compile or a killed process must never leave a partial
+        # entry under the final name, so write a private file and rename it
+        temp = cached.with_name(f"{cached.name}.{os.getpid()}.tmp")
+        try:
+            self.write_file(temp, data)
+            os.replace(temp, cached)
+        except OSError:
+            try:
+                os.remove(temp)
+            except OSError:
+                pass
+            raise
+        self.prune_cache()
+    
+    def prune_cache(self) -> None:
+        """Delete the least recently used cache files while the cache exceeds CACHE_MAX_BYTES"""
+        entries = []
+        total = 0
+        for entry in self.cache_dir.iterdir():
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry))
+            total += stat.st_size
+        for _, size, entry in sorted(entries):
+            if total <= CACHE_MAX_BYTES:
+                break
+            try:
+                entry.unlink()
+            except OSError:
+                continue
+            total -= size
+    
+    def load_import(self, path: Path) -> Program:
+        """AST loader for import statements, recording the file as a dependency of this build"""
+        path = Path(path).resolve()
+        self.imported_files[path] = file_mtime(path)
+        return self.load_ast(path, show_tokens=False)
+    
+    def scan_imports(self, source: Path, scanned: dict) -> set:
+        """
+        Resolved paths named by the import statements in a source file. Only the
+        tokens are read, so this neither reports parse errors nor runs codegen;
+        results are kept in scanned until the file's mtime changes.
+        """
+        mtime = file_mtime(source)
+        entry = scanned.get(source)
+        if entry is not None and entry[0] == mtime:
+            return entry[1]
+        imports = set()
+        try:
+            tokens = FluxLexer(source.read_text()).tokenize()
+        except (OSError, UnicodeDecodeError):
+            tokens = []
+        for token, following in zip(tokens, tokens[1:]):
+            if token.type is TokenType.IMPORT and following.type is TokenType.STRING_LITERAL:
+                try:
+                    resolved = ImportStatement(following.value)._resolve_path(following.value)
+                except ImportError:
+                    resolved = None
+                if resolved is not None:
+                    imports.add(resolved)
+        scanned[source] = (mtime, imports)
+        return imports
+    
+    def get_frontend_digest(self) -> bytes:
+        """Digest of the lexer, parser and AST sources, used to key the AST cache"""
+        if self.frontend_digest is None:
+            digest = hashlib.blake2b(digest_size=16)
+            for name in FRONTEND_SOURCES:
+                digest.update((Path(__file__).parent / name).read_bytes())
+            self.frontend_digest = digest.digest()
+        return self.frontend_digest
+    
+    def write_file(self, path: Path, data: bytes) -> None:
+        """Write bytes straight to a fresh fd, bypassing the text I/O layer"""
+        fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                # os.write may write less than requested for large buffers
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+    
+    def run_tool(self, args: list) -> None:
+        """Run a toolchain command, raising CalledProcessError on failure"""
+        # An absolute executable with close_fds=False lets subprocess use
+        # posix_spawn instead of fork+exec of the whole interpreter
+        tool = shutil.which(args[0]) or args[0]
+        subprocess.run(args, executable=tool, close_fds=False, check=True)
+    
     def cleanup(self):
         """Remove temporary files"""
         for f in self.temp_files:
@@ -135,51 +311,87 @@ class FluxCompiler:
                     os.remove(f)
             except:
                 pass
+        self.temp_files.clear()
+
+    def watch(self, path: str, output_bin: str = None, interval: float = 0.5) -> None:
+        """
+        Recompile a .fx file, or every entry .fx file under a directory, whenever it or
+        any file it imports changes. A file imported by another file under the directory
+        is a module: editing it rebuilds its importers, but it is never linked on its own.
+        Runs until interrupted, reusing this compiler (and the loaded LLVM) for every build.
+        """
+        root = Path(path).resolve()
+        scanned = {}
+        # Entry file -> mtimes of it and everything it imported, as read by its last build
+        built = {}
+        print(f"Watching {root} for changes (Ctrl+C to stop)")
+        try:
+            while True:
+                files = [root] if root.is_file() else sorted(source.resolve() for source in root.rglob("*.fx"))
+                modules = set()
+                if not root.is_file():
+                    for source in files:
+                        modules |= self.scan_imports(source, scanned) - {source}
+                for source in files:
+                    if source in modules:
+                        continue
+                    stamps = built.get(source)
+                    if stamps is not None and all(file_mtime(dep) == mtime for dep, mtime in stamps.items()):
+                        continue
+                    mtime = file_mtime(source)
+                    try:
+                        self.compile_file(str(source), output_bin if root.is_file() else None)
+                    except SystemExit:
+                        # compile_file has already reported the failure
+                        pass
+                    finally:
+                        self.cleanup()
+                    built[source] = {source: mtime, **self.imported_files}
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            pass
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python fc.py input.fx [output_binary] ...arguments...\n\n")
-        print("\tArguments:\n")
-        print("\t\t-vX\tVerbose output. X = 0..4\n")
-        print("\t\t\t\t0: Tokens")
-        print("\t\t\t\t1: AST")
-        print("\t\t\t\t2: LLVM IR")
-        print("\t\t\t\t3: ASM")
-        print("\t\t\t\t4: Everything")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description='Flux Compiler (fc.py)')
+    parser.add_argument('input', help='Flux source file to compile (.fx), or a directory with --watch')
+    parser.add_argument('output', nargs='?', help='Output binary name')
+    parser.add_argument('-v', type=int, choices=range(5), metavar='X',
+                        help='Verbose output. X = 0..4 (0: Tokens, 1: AST, 2: LLVM IR, 3: ASM, 4: Everything)')
+    parser.add_argument('-o', action='store_true',
+                        help='Only parse the input and print its AST')
+    parser.add_argument('-O', type=int, choices=range(4), default=3, metavar='N',
+                        help='llc optimization level. N = 0..3 (default: 3)')
+    parser.add_argument('--mcpu', default='generic',
+                        help='Target CPU passed to llc (default: generic; native tunes the binary to this machine only)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Always lex and parse, ignoring ~/.flux_cache')
+    parser.add_argument('--watch', action='store_true',
+                        help='Stay running and recompile the input whenever it changes')
+    args = parser.parse_args()
 
-    input_file = None
-    output_bin = None
-
-    if len(sys.argv) == 2:
-        input_file = sys.argv[1]
-        output_bin = sys.argv[2] if len(sys.argv) > 2 else None
-
-    verbosity = None
-
-    if len(sys.argv) > 2:
-        input_file = sys.argv[1]
-        output_bin = sys.argv[2] if len(sys.argv) > 2 else None
-        for arg in sys.argv:
-            if arg.lower().startswith("-v"):
-                if len(arg) > 2 and arg[2:].isdigit():
-                    verbosity = int(arg[2:])
-            elif arg.lower() == "-o":
-                    with open(input_file, 'r') as f:
-                        source = f.read()
-                    lexer = FluxLexer(source)
-                    tokens = lexer.tokenize()
-                    parser = FluxParser(tokens)
-                    ast = parser.parse()
-                    print(ast)
-                    return
+    if sys.getrecursionlimit() < RECURSION_LIMIT:
+        sys.setrecursionlimit(RECURSION_LIMIT)
 
+    input_file = args.input
+    output_bin = args.output
+
+    compiler = FluxCompiler(verbosity=args.v, use_cache=not args.no_cache,
+                            opt_level=args.O, cpu=args.mcpu)
+    if args.o:
+        try:
+            print(compiler.load_ast(input_file))
+        except Exception as e:
+            print(f"Compilation failed: {e}", file=sys.stderr)
+            sys.exit(1)
+        return
     
-    if not input_file.endswith('.fx'):
+    if not input_file.endswith('.fx') and not (args.watch and os.path.isdir(input_file)):
         print("Error: Input file must have .fx extension", file=sys.stderr)
         sys.exit(1)
     
-    compiler = FluxCompiler(verbosity=verbosity)
+    if args.watch:
+        compiler.watch(input_file, output_bin)
+        return
     try:
         binary_path = compiler.compile_file(input_file, output_bin)
         print(f"Executable created at: {binary_path}")
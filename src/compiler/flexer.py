@@ -10,11 +10,14 @@ Usage:
 """
 
 import re
-from enum import Enum, auto
+import sys
+from enum import IntEnum, auto
 from dataclasses import dataclass
-from typing import List, Optional, Iterator
+from typing import List, Optional, Iterator, Union
 
-class TokenType(Enum):
+# IntEnum so that hashing a token type (every set/dict lookup in the parser)
+# is int's C-level hash rather than Enum's Python-level __hash__
+class TokenType(IntEnum):
     # Literals
     INTEGER = auto()
     FLOAT = auto()
@@ -157,12 +160,15 @@ class TokenType(Enum):
     EOF = auto()
     NEWLINE = auto()
 
-@dataclass
+# Slotted: a source file produces one Token per lexeme, and the parser reads the
+# per-token fields through its parallel types list and these slots
+@dataclass(slots=True)
 class Token:
     type: TokenType
     value: str
     line: int
     column: int
+    number: Union[int, float, None] = None  # Converted value of INTEGER/FLOAT literals
 
 class FluxLexer:
     def __init__(self, source_code: str):
@@ -275,10 +281,18 @@ class FluxLexer:
         start_pos = (self.line, self.column)
         self.advance()  # Skip opening quote
         
-        result = ""
-        while self.current_char() and not (self.current_char() == '"' and self.peek_char() == '"'):
-            result += self.current_char()
-            self.advance()
+        # Find the closing quotes with one search instead of stepping per character
+        end = self.source.find('""', self.position)
+        if end == -1:
+            end = self.length
+        result = self.source[self.position:end]
+        newlines = result.count('\n')
+        if newlines:
+            self.line += newlines
+            self.column = len(result) - result.rfind('\n')
+        else:
+            self.column += len(result)
+        self.position = end
         
         if self.current_char() == '"' and self.peek_char() == '"':
             self.advance(count=2)  # Skip closing quotes
@@ -374,7 +388,7 @@ class FluxLexer:
                 while self.current_char() and self.current_char() in '0123456789abcdefABCDEF':
                     result += self.current_char()
                     self.advance()
-                return Token(TokenType.INTEGER, result, start_pos[0], start_pos[1])
+                return self.integer_token(result, start_pos)
             
             elif self.current_char() and self.current_char().lower() == 'b':
                 # Binary
@@ -383,7 +397,7 @@ class FluxLexer:
                 while self.current_char() and self.current_char() in '01':
                     result += self.current_char()
                     self.advance()
-                return Token(TokenType.INTEGER, result, start_pos[0], start_pos[1])
+                return self.integer_token(result, start_pos)
         
         # Read decimal digits
         while self.current_char() and self.current_char().isdigit():
@@ -400,8 +414,19 @@ class FluxLexer:
                 self.advance()
 
         
-        token_type = TokenType.FLOAT if is_float else TokenType.INTEGER
-        return Token(token_type, result, start_pos[0], start_pos[1])
+        if is_float:
+            return Token(TokenType.FLOAT, result, start_pos[0], start_pos[1], float(result))
+        return self.integer_token(result, start_pos)
+    
+    def integer_token(self, text: str, start_pos: tuple) -> Token:
+        # Text such as '09', a bare '0x' or a GAS label reference like '1b' is
+        # still a token (asm bodies keep it verbatim); it just has no value, and
+        # the parser reports it if it is used as a number
+        try:
+            number = int(text, 0)
+        except ValueError:
+            number = None
+        return Token(TokenType.INTEGER, text, start_pos[0], start_pos[1], number)
     
     def read_identifier(self) -> Token:
         start_pos = (self.line, self.column)
@@ -418,6 +443,10 @@ class FluxLexer:
         # Special handling for boolean literals
         if result == 'true' or result == 'false':
             token_type = TokenType.BOOL
+        elif token_type is TokenType.IDENTIFIER:
+            # Every use of a name shares one string, which the AST and the
+            # codegen scopes then compare by identity first
+            result = sys.intern(result)
         
         return Token(token_type, result, start_pos[0], start_pos[1])
     
@@ -0,0 +1,28 @@
+# Augmenting declarations for the optional Cython build of fparser.py (see setup.py).
+# Plain Python ignores this file. Under Cython, FluxParser becomes an extension type
+# with typed attribute slots, and the methods on the per-token path become cpdef so
+# calls between them go through a C vtable instead of Python attribute lookup.
+
+cdef class FluxParser:
+    cdef public list tokens
+    cdef public list types
+    cdef public Py_ssize_t position
+    cdef public object current_token
+    cdef public list errors
+    cdef public list memo
+
+    cpdef advance(self)
+    cpdef expect_any(self, frozenset token_types)
+    cpdef consume(self, expected_type, str message=*)
+    cpdef statement(self)
+    cpdef type_spec(self)
+    cpdef base_type(self)
+    cpdef is_variable_declaration(self)
+    cpdef variable_declaration(self)
+    cpdef block(self)
+    cpdef expression_statement(self)
+    cpdef cast_expression(self)
+    cpdef unary_expression(self)
+    cpdef postfix_expression(self)
+    cpdef argument_list(self)
+    cpdef primary_expression(self)
@@ -12,10 +12,196 @@ Usage:
 """
 
 import sys
+import functools
 from typing import List, Optional, Union, Any
 from flexer import FluxLexer, TokenType, Token
 from fast import *
 
+# Module-level aliases for the token types the parser compares against. Looking up
+# TokenType.X goes through the enum class on every check; a module global is a plain
+# dict lookup. The aliases are the enum members themselves, so 'is' checks still hold.
+TT_INTEGER = TokenType.INTEGER
+TT_FLOAT = TokenType.FLOAT
+TT_CHAR = TokenType.CHAR
+TT_STRING_LITERAL = TokenType.STRING_LITERAL
+TT_IDENTIFIER = TokenType.IDENTIFIER
+TT_ALIGNOF = TokenType.ALIGNOF
+TT_AND = TokenType.AND
+TT_AS = TokenType.AS
+TT_ASM = TokenType.ASM
+TT_ASSERT = TokenType.ASSERT
+TT_AUTO = TokenType.AUTO
+TT_BREAK = TokenType.BREAK
+TT_BOOL_KW = TokenType.BOOL_KW
+TT_CASE = TokenType.CASE
+TT_CATCH = TokenType.CATCH
+TT_CONST = TokenType.CONST
+TT_CONTINUE = TokenType.CONTINUE
+TT_DATA = TokenType.DATA
+TT_DEF = TokenType.DEF
+TT_DEFAULT = TokenType.DEFAULT
+TT_DO = TokenType.DO
+TT_ELIF = TokenType.ELIF
+TT_ELSE = TokenType.ELSE
+TT_FALSE = TokenType.FALSE
+TT_FLOAT_KW = TokenType.FLOAT_KW
+TT_FOR = TokenType.FOR
+TT_FROM = TokenType.FROM
+TT_IF = TokenType.IF
+TT_IMPORT = TokenType.IMPORT
+TT_IN = TokenType.IN
+TT_INT = TokenType.INT
+TT_NAMESPACE = TokenType.NAMESPACE
+TT_NOT = TokenType.NOT
+TT_OBJECT = TokenType.OBJECT
+TT_OR = TokenType.OR
+TT_PRIVATE = TokenType.PRIVATE
+TT_PUBLIC = TokenType.PUBLIC
+TT_RETURN = TokenType.RETURN
+TT_SIGNED = TokenType.SIGNED
+TT_SIZEOF = TokenType.SIZEOF
+TT_STRUCT = TokenType.STRUCT
+TT_SUPER = TokenType.SUPER
+TT_SWITCH = TokenType.SWITCH
+TT_THIS = TokenType.THIS
+TT_THROW = TokenType.THROW
+TT_TRUE = TokenType.TRUE
+TT_TRY = TokenType.TRY
+TT_UNION = TokenType.UNION
+TT_UNSIGNED = TokenType.UNSIGNED
+TT_USING = TokenType.USING
+TT_VOID = TokenType.VOID
+TT_VOLATILE = TokenType.VOLATILE
+TT_WHILE = TokenType.WHILE
+TT_XOR = TokenType.XOR
+TT_UINT8 = TokenType.UINT8
+TT_UINT16 = TokenType.UINT16
+TT_UINT32 = TokenType.UINT32
+TT_UINT64 = TokenType.UINT64
+TT_INT8 = TokenType.INT8
+TT_INT16 = TokenType.INT16
+TT_INT32 = TokenType.INT32
+TT_INT64 = TokenType.INT64
+TT_PLUS = TokenType.PLUS
+TT_MINUS = TokenType.MINUS
+TT_MULTIPLY = TokenType.MULTIPLY
+TT_DIVIDE = TokenType.DIVIDE
+TT_MODULO = TokenType.MODULO
+TT_INCREMENT = TokenType.INCREMENT
+TT_DECREMENT = TokenType.DECREMENT
+TT_EQUAL = TokenType.EQUAL
+TT_NOT_EQUAL = TokenType.NOT_EQUAL
+TT_LESS_THAN = TokenType.LESS_THAN
+TT_LESS_EQUAL = TokenType.LESS_EQUAL
+TT_GREATER_THAN = TokenType.GREATER_THAN
+TT_GREATER_EQUAL = TokenType.GREATER_EQUAL
+TT_LEFT_SHIFT = TokenType.LEFT_SHIFT
+TT_RIGHT_SHIFT = TokenType.RIGHT_SHIFT
+TT_ASSIGN = TokenType.ASSIGN
+TT_ADDRESS_OF = TokenType.ADDRESS_OF
+TT_SCOPE = TokenType.SCOPE
+TT_COLON = TokenType.COLON
+TT_RETURN_ARROW = TokenType.RETURN_ARROW
+TT_LEFT_PAREN = TokenType.LEFT_PAREN
+TT_RIGHT_PAREN = TokenType.RIGHT_PAREN
+TT_LEFT_BRACKET = TokenType.LEFT_BRACKET
+TT_RIGHT_BRACKET = TokenType.RIGHT_BRACKET
+TT_LEFT_BRACE = TokenType.LEFT_BRACE
+TT_RIGHT_BRACE = TokenType.RIGHT_BRACE
+TT_SEMICOLON = TokenType.SEMICOLON
+TT_COMMA = TokenType.COMMA
+TT_DOT = TokenType.DOT
+TT_EOF = TokenType.EOF
+
+# Operator and DataType members the rules construct nodes with, aliased the same
+# way as the token types above
+OP_NOT = Operator.NOT
+OP_SUB = Operator.SUB
+OP_ADD = Operator.ADD
+OP_INCREMENT = Operator.INCREMENT
+OP_DECREMENT = Operator.DECREMENT
+DT_DATA = DataType.DATA
+DT_INT = DataType.INT
+DT_FLOAT = DataType.FLOAT
+DT_CHAR = DataType.CHAR
+DT_BOOL = DataType.BOOL
+DT_VOID = DataType.VOID
+
+# Token sets for multi-way checks, built once at import (see FluxParser.expect_any)
+SYNC_TOKENS = frozenset({
+    TT_DEF, TT_STRUCT, TT_OBJECT, TT_NAMESPACE, TT_IF,
+    TT_WHILE, TT_FOR, TT_RETURN, TT_IMPORT,
+})
+ACCESS_SPECIFIERS = frozenset({TT_PUBLIC, TT_PRIVATE})
+SIGN_SPECIFIERS = frozenset({TT_SIGNED, TT_UNSIGNED})
+TYPE_QUALIFIERS = frozenset({TT_CONST, TT_VOLATILE, TT_SIGNED, TT_UNSIGNED})
+BASE_TYPE_TOKENS = frozenset({
+    TT_INT, TT_FLOAT_KW, TT_CHAR, TT_BOOL_KW, TT_DATA,
+    TT_VOID, TT_IDENTIFIER, TT_UINT8, TT_UINT16, TT_UINT32,
+    TT_UINT64, TT_INT8, TT_INT16, TT_INT32, TT_INT64,
+})
+DECLARATOR_TOKENS = frozenset({TT_IDENTIFIER, TT_AS})
+# Tokens that end a brace-delimited list; EOF stops a truncated body so the
+# closing consume reports it instead of an inner rule
+BLOCK_END_TOKENS = frozenset({TT_RIGHT_BRACE, TT_EOF})
+# Tokens that can begin a unary_expression, i.e. the operand of a cast
+UNARY_START_TOKENS = frozenset({
+    TT_NOT, TT_MINUS, TT_PLUS, TT_MULTIPLY, TT_ADDRESS_OF, TT_INCREMENT, TT_DECREMENT,
+    TT_IDENTIFIER, TT_XOR, TT_INTEGER, TT_FLOAT, TT_CHAR, TT_STRING_LITERAL, TT_TRUE,
+    TT_FALSE, TT_VOID, TT_THIS, TT_SUPER, TT_LEFT_PAREN, TT_LEFT_BRACKET, TT_LEFT_BRACE,
+    TT_SIZEOF, TT_ALIGNOF,
+})
+
+# Token type -> DataType for base_type(); custom type names are treated as DATA for now
+BASE_TYPES = {
+    TT_INT: DataType.INT,
+    TT_FLOAT_KW: DataType.FLOAT,
+    TT_CHAR: DataType.CHAR,
+    TT_BOOL_KW: DataType.BOOL,
+    TT_DATA: DataType.DATA,
+    TT_VOID: DataType.VOID,
+    TT_THIS: DataType.THIS,
+    # Fixed-width integer types
+    TT_UINT8: DataType.UINT8,
+    TT_UINT16: DataType.UINT16,
+    TT_UINT32: DataType.UINT32,
+    TT_UINT64: DataType.UINT64,
+    TT_INT8: DataType.INT8,
+    TT_INT16: DataType.INT16,
+    TT_INT32: DataType.INT32,
+    TT_INT64: DataType.INT64,
+    TT_IDENTIFIER: DataType.DATA,
+}
+
+# Binary operators for FluxParser.binary_expression: token type -> (binding power, operator).
+# Higher powers bind tighter; all of these are left-associative
+BINARY_OPERATORS = {
+    TT_OR: (1, Operator.OR),
+    TT_AND: (2, Operator.AND),
+    TT_XOR: (3, Operator.XOR),
+    TT_EQUAL: (4, Operator.EQUAL),
+    TT_NOT_EQUAL: (4, Operator.NOT_EQUAL),
+    TT_LESS_THAN: (5, Operator.LESS_THAN),
+    TT_LESS_EQUAL: (5, Operator.LESS_EQUAL),
+    TT_GREATER_THAN: (5, Operator.GREATER_THAN),
+    TT_GREATER_EQUAL: (5, Operator.GREATER_EQUAL),
+    TT_LEFT_SHIFT: (6, Operator.BITSHIFT_LEFT),
+    TT_RIGHT_SHIFT: (6, Operator.BITSHIFT_RIGHT),
+    TT_PLUS: (7, Operator.ADD),
+    TT_MINUS: (7, Operator.SUB),
+    TT_MULTIPLY: (8, Operator.MUL),
+    TT_DIVIDE: (8, Operator.DIV),
+    TT_MODULO: (8, Operator.MOD),
+}
+
+# Type specs are never mutated after parsing, so identical shapes ('int', 'unsigned data{8}[]', ...)
+# share a single TypeSpec instead of allocating one per occurrence
+@functools.lru_cache(maxsize=4096)
+def make_type_spec(base_type, is_signed, is_const, is_volatile, bit_width, alignment,
+                   is_array, array_size, is_pointer) -> TypeSpec:
+    return TypeSpec(base_type, is_signed, is_const, is_volatile,
+                    bit_width, alignment, is_array, array_size, is_pointer)
+
 class ParseError(Exception):
     """Exception raised when parsing fails"""
     def __init__(self, message: str, token: Optional[Token] = None):
@@ -23,16 +209,75 @@ class ParseError(Exception):
         self.token = token
         super().__init__(f"Parse error: {message}" + (f" at {token.line}:{token.column}" if token else ""))
 
+# Packrat memoization for rules that backtracking paths re-enter at the same
+# position; active from the first failed cast guess, or from the start with
+# FluxParser(tokens, memoize=True)
+MEMO_MISS = object()
+MEMO_RULES: List[str] = []
+
+def memoize(rule):
+    """
+    Memoize an argument-less parser rule on the token position it starts at.
+    Each decorated rule gets its own table indexed by position; a result is
+    replayed on a later call from the same position (the same node object, so
+    it may appear twice in the tree), and a failure is raised again as a fresh
+    ParseError. While the parser's memo is None the rule runs directly.
+    """
+    rule_id = len(MEMO_RULES)
+    MEMO_RULES.append(rule.__name__)
+    
+    @functools.wraps(rule)
+    def wrapper(self):
+        memo = self.memo
+        if memo is None:
+            return rule(self)
+        table = memo[rule_id]
+        if table is None:
+            table = memo[rule_id] = [MEMO_MISS] * len(self.types)
+        start = self.position
+        entry = table[start]
+        if entry is not MEMO_MISS:
+            end, result = entry
+            if end is None:
+                raise ParseError(result.message, result.token)
+            self.position = end
+            self.current_token = self.tokens[end]
+            return result
+        try:
+            result = rule(self)
+        except ParseError as e:
+            table[start] = (None, e)
+            raise
+        table[start] = (self.position, result)
+        return result
+    return wrapper
+
 class FluxParser:
-    def __init__(self, tokens: List[Token]):
+    __slots__ = ('tokens', 'types', 'position', 'current_token', 'errors', 'memo')
+    
+    def __init__(self, tokens: List[Token], memoize: bool = False):
         self.tokens = tokens
+        # Token types as a parallel list: type-only lookahead and scans touch
+        # this instead of dereferencing a Token object per check
+        self.types = [token.type for token in tokens]
         self.position = 0
         self.current_token = self.tokens[0] if tokens else None
+        self.errors: List[ParseError] = []
+        # One position-indexed table per @memoize rule, allocated on first use;
+        # None leaves every rule unmemoized
+        self.memo = [None] * len(MEMO_RULES) if memoize else None
     
     def error(self, message: str) -> None:
         """Raise a parse error with current token context"""
         raise ParseError(message, self.current_token)
     
+    def integer(self) -> int:
+        """Consume an integer literal and return its value"""
+        token = self.consume(TT_INTEGER)
+        if token.number is None:
+            raise ParseError(f"Invalid integer literal '{token.value}'", token)
+        return token.number
+    
     def advance(self) -> Token:
         """Move to the next token"""
         if self.position < len(self.tokens) - 1:
@@ -40,6 +285,11 @@ class FluxParser:
             self.current_token = self.tokens[self.position]
         return self.current_token
     
+    def seek(self, position):
+        """Move to an arbitrary token position"""
+        self.position = position
+        self.current_token = self.tokens[position]
+    
     def peek(self, offset: int = 1) -> Optional[Token]:
         """Look ahead at the next token without consuming it"""
         pos = self.position + offset
@@ -53,44 +303,68 @@ class FluxParser:
             return False
         return self.current_token.type in token_types
     
+    def expect_any(self, token_types: frozenset) -> bool:
+        """Check if current token is in a precomputed set of token types"""
+        return self.current_token is not None and self.current_token.type in token_types
+    
     def consume(self, expected_type: TokenType, message: str = None) -> Token:
         """Consume a token of the expected type or raise error"""
-        if not self.expect(expected_type):
-            msg = message or f"Expected {expected_type.name}, got {self.current_token.type.name if self.current_token else 'EOF'}"
-            self.error(msg)
         token = self.current_token
-        self.advance()
+        if token is None or token.type is not expected_type:
+            self.error(message or f"Expected {expected_type.name}, got {token.type.name if token else 'EOF'}")
+        # advance() inlined: a matched token is never the trailing EOF, so a next
+        # token always exists. Hot expression rules step the same way after
+        # matching an operator or literal.
+        self.position += 1
+        self.current_token = self.tokens[self.position]
         return token
     
-    def synchronize(self) -> None:
+    def synchronize(self, start: Optional[int] = None) -> None:
         """Synchronize parser state after an error"""
-        self.advance()
-        while not self.expect(TokenType.EOF):
-            if self.tokens[self.position - 1].type == TokenType.SEMICOLON:
+        types = self.types
+        # A statement that failed after consuming input (start is where it began)
+        # and stopped on a statement keyword can resume right there; skipping
+        # ahead would throw that next statement away and cascade further errors.
+        # Only when the keyword is at the brace depth the statement started at:
+        # one nested inside the failed statement's body would be parsed as a
+        # top-level statement and fail again at the body's closing brace
+        if start is not None and self.position > start and types[self.position] in SYNC_TOKENS:
+            consumed = types[start:self.position]
+            if consumed.count(TT_LEFT_BRACE) == consumed.count(TT_RIGHT_BRACE):
                 return
-            if self.expect(TokenType.DEF, TokenType.STRUCT, TokenType.OBJECT, 
-                         TokenType.NAMESPACE, TokenType.IF, TokenType.WHILE,
-                         TokenType.FOR, TokenType.RETURN, TokenType.IMPORT):
-                return
-            self.advance()
+        # Scan the type list by index and move the parser once at the end
+        last = len(types) - 1
+        i = min(self.position + 1, last)
+        while i < last and types[i] is not TT_EOF:
+            if types[i - 1] is TT_SEMICOLON or types[i] in SYNC_TOKENS:
+                break
+            i += 1
+        self.seek(i)
 
     # ============ GRAMMAR RULES ============
     
     def parse(self) -> Program:
         """
         program -> statement* EOF
+        
+        Every statement rule returns a single Statement, or None for input
+        that produces no node (such as a stray ';').
         """
+        types = self.types
         statements = []
-        while not self.expect(TokenType.EOF):
+        append = statements.append
+        rules = STATEMENT_RULES.get
+        while types[self.position] is not TT_EOF:
+            start = self.position
             try:
-                stmt = self.statement()
-                if isinstance(stmt, list):
-                    statements.extend(stmt)
-                elif stmt:
-                    statements.append(stmt)
+                rule = rules(types[self.position])
+                stmt = rule(self) if rule is not None else self.statement()
+                if stmt is not None:
+                    append(stmt)
             except ParseError as e:
                 print(f"Parse error: {e}", file=sys.stderr)
-                self.synchronize()
+                self.errors.append(e)
+                self.synchronize(start)
         return Program(statements)
     
     def statement(self) -> Optional[Statement]:
@@ -106,78 +380,52 @@ class FluxParser:
                   | assignment_statement
                   | control_statement
         """
-        if self.expect(TokenType.IMPORT):
-            return self.import_statement()
-        elif self.expect(TokenType.USING):
-            return self.using_statement()
-        elif self.expect(TokenType.DEF):
-            return self.function_def()
-        elif self.expect(TokenType.UNION):
-            return self.union_def()
-        elif self.expect(TokenType.STRUCT):
-            return self.struct_def()
-        elif self.expect(TokenType.OBJECT):
-            return self.object_def()
-        elif self.expect(TokenType.NAMESPACE):
-            return self.namespace_def()
-        elif self.expect(TokenType.IF):
-            return self.if_statement()
-        elif self.expect(TokenType.WHILE):
-            return self.while_statement()
-        elif self.expect(TokenType.FOR):
-            return self.for_statement()
-        elif self.expect(TokenType.DO):
-            return self.do_while_statement()
-        elif self.expect(TokenType.SWITCH):
-            return self.switch_statement()
-        elif self.expect(TokenType.TRY):
-            return self.try_statement()
-        elif self.expect(TokenType.RETURN):
-            return self.return_statement()
-        elif self.expect(TokenType.BREAK):
-            return self.break_statement()
-        elif self.expect(TokenType.CONTINUE):
-            return self.continue_statement()
-        elif self.expect(TokenType.THROW):
-            return self.throw_statement()
-        elif self.expect(TokenType.ASSERT):
-            return self.assert_statement()
-        elif self.expect(TokenType.LEFT_BRACE):
-            return self.block_statement()
-        elif self.is_variable_declaration():
-            return self.variable_declaration_statement()
-        elif self.expect(TokenType.UNSIGNED):
+        rule = STATEMENT_RULES.get(self.current_token.type)
+        if rule is not None:
+            return rule(self)
+        if self.is_variable_declaration() or self.expect_any(SIGN_SPECIFIERS):
             return self.variable_declaration_statement()
-        elif self.expect(TokenType.SIGNED):
-            return self.variable_declaration_statement()
-        elif self.expect(TokenType.CONST):
-            self.advance()
-            if self.expect(TokenType.VOLATILE):
-                self.advance()
-                if self.expect(TokenType.DEF):
-                    return self.function_def()
-                else:
-                    return self.variable_declaration_statement()
-        elif self.expect(TokenType.SEMICOLON):
+        if self.current_token.type is TT_CONST:
+            return self.const_statement()
+        return self.expression_statement()
+    
+    def const_statement(self) -> Optional[Statement]:
+        """
+        const_statement -> 'const' 'volatile' (function_def | variable_declaration_statement)
+        """
+        self.consume(TT_CONST)
+        if self.current_token.type is TT_VOLATILE:
             self.advance()
-            return None
-        elif self.expect(TokenType.AUTO) and self.peek() and self.peek().type == TokenType.LEFT_BRACE:
-            # Handle destructuring assignment
+            if self.current_token.type is TT_DEF:
+                return self.function_def()
+            else:
+                return self.variable_declaration_statement()
+        return None
+    
+    def empty_statement(self) -> None:
+        """
+        empty_statement -> ';'
+        """
+        self.consume(TT_SEMICOLON)
+        return None
+    
+    def auto_statement(self) -> Statement:
+        """
+        auto_statement -> destructuring_assignment ';' | expression_statement
+        """
+        if self.peek() and self.peek().type == TT_LEFT_BRACE:
             destructure = self.destructuring_assignment()
-            self.consume(TokenType.SEMICOLON)
+            self.consume(TT_SEMICOLON)
             return destructure
-        elif self.expect(TokenType.ASM):
-            return self.asm_statement()
-        else:
-            return self.expression_statement()
+        return self.expression_statement()
     
     def import_statement(self) -> ImportStatement:
         """
         import_statement -> 'import' STRING_LITERAL ';'
         """
-        self.consume(TokenType.IMPORT)
-        module_name = self.consume(TokenType.STRING_LITERAL).value
-        self.consume(TokenType.SEMICOLON)
+        self.consume(TT_IMPORT)
+        module_name = self.consume(TT_STRING_LITERAL).value
+        self.consume(TT_SEMICOLON)
         return ImportStatement(module_name)
     
     def using_statement(self) -> UsingStatement:
@@ -185,17 +433,18 @@ class FluxParser:
         using_statement -> 'using' namespace_path (',' namespace_path)* ';'
         namespace_path -> IDENTIFIER ('::' IDENTIFIER)*
         """
-        self.consume(TokenType.USING)
+        self.consume(TT_USING)
         
         # Parse namespace path (e.g., "standard::io")
-        namespace_path = self.consume(TokenType.IDENTIFIER).value
-        while self.expect(TokenType.SCOPE):  # ::
+        parts = [self.consume(TT_IDENTIFIER).value]
+        while self.current_token.type is TT_SCOPE:  # ::
             self.advance()
-            namespace_path += "::" + self.consume(TokenType.IDENTIFIER).value
+            parts.append(self.consume(TT_IDENTIFIER).value)
+        namespace_path = "::".join(parts)
         
         # For now, handle only single namespace per statement
         # TODO: Add support for comma-separated namespaces
-        self.consume(TokenType.SEMICOLON)
+        self.consume(TT_SEMICOLON)
         return UsingStatement(namespace_path)
     
     def function_def(self) -> FunctionDef:
@@ -206,34 +455,34 @@ class FluxParser:
         is_const = False
         is_volatile = False
         
-        if self.expect(TokenType.CONST):
+        if self.current_token.type is TT_CONST:
             is_const = True
             self.advance()
         
-        if self.expect(TokenType.VOLATILE):
+        if self.current_token.type is TT_VOLATILE:
             is_volatile = True
             self.advance()
         
-        self.consume(TokenType.DEF)
-        name = self.consume(TokenType.IDENTIFIER).value
+        self.consume(TT_DEF)
+        name = self.consume(TT_IDENTIFIER).value
         
-        self.consume(TokenType.LEFT_PAREN)
-        parameters = self.parameter_list() if not self.expect(TokenType.RIGHT_PAREN) else []
-        self.consume(TokenType.RIGHT_PAREN)
+        self.consume(TT_LEFT_PAREN)
+        parameters = self.parameter_list() if self.current_token.type is not TT_RIGHT_PAREN else []
+        self.consume(TT_RIGHT_PAREN)
         
-        self.consume(TokenType.RETURN_ARROW)
+        self.consume(TT_RETURN_ARROW)
         return_type = self.type_spec()
         
         # Check if this is a prototype (ends with semicolon) or definition (has block)
         is_prototype = False
         body = None
-        if self.expect(TokenType.SEMICOLON):
+        if self.current_token.type is TT_SEMICOLON:
             is_prototype = True
             self.advance()
             body = Block([])  # Empty block for prototype
         else:
             body = self.block()
-            self.consume(TokenType.SEMICOLON)
+            self.consume(TT_SEMICOLON)
         
         return FunctionDef(name, parameters, return_type, body, is_const, is_volatile, is_prototype)
     
@@ -241,9 +490,10 @@ class FluxParser:
         """
         parameter_list -> parameter (',' parameter)*
         """
+        types = self.types
         params = [self.parameter()]
         
-        while self.expect(TokenType.COMMA):
+        while types[self.position] is TT_COMMA:
             self.advance()
             params.append(self.parameter())
         
@@ -254,29 +504,30 @@ class FluxParser:
         parameter -> type_spec IDENTIFIER
         """
         type_spec = self.type_spec()
-        name = self.consume(TokenType.IDENTIFIER).value
+        name = self.consume(TT_IDENTIFIER).value
         return Parameter(name, type_spec)
 
     def union_def(self) -> UnionDef:
         """
         union_def -> 'union' IDENTIFIER (';' | '{' union_member* '}' ';')
         """
-        self.consume(TokenType.UNION)
-        name = self.consume(TokenType.IDENTIFIER).value
+        types = self.types
+        self.consume(TT_UNION)
+        name = self.consume(TT_IDENTIFIER).value
         
         # Handle forward declaration
-        if self.expect(TokenType.SEMICOLON):
+        if self.current_token.type is TT_SEMICOLON:
             self.advance()
             return UnionDef(name, [])
         
-        self.consume(TokenType.LEFT_BRACE)
+        self.consume(TT_LEFT_BRACE)
         members = []
         
-        while not self.expect(TokenType.RIGHT_BRACE):
+        while types[self.position] not in BLOCK_END_TOKENS:
             members.append(self.union_member())
         
-        self.consume(TokenType.RIGHT_BRACE)
-        self.consume(TokenType.SEMICOLON)
+        self.consume(TT_RIGHT_BRACE)
+        self.consume(TT_SEMICOLON)
         return UnionDef(name, members)
 
     def union_member(self) -> UnionMember:
@@ -284,77 +535,45 @@ class FluxParser:
         union_member -> type_spec IDENTIFIER ('=' expression)? ';'
         """
         type_spec = self.type_spec()
-        name = self.consume(TokenType.IDENTIFIER).value
+        name = self.consume(TT_IDENTIFIER).value
         
         # Optional initial value
         initial_value = None
-        if self.expect(TokenType.ASSIGN):
+        if self.current_token.type is TT_ASSIGN:
             self.advance()
             initial_value = self.expression()
         
-        self.consume(TokenType.SEMICOLON)
+        self.consume(TT_SEMICOLON)
         return UnionMember(name, type_spec, initial_value)
     
     def struct_def(self) -> StructDef:
         """
         struct_def -> 'struct' IDENTIFIER'{' struct_member* '}'
         """
-        self.consume(TokenType.STRUCT)
-        name = self.consume(TokenType.IDENTIFIER).value
+        types = self.types
+        self.consume(TT_STRUCT)
+        name = self.consume(TT_IDENTIFIER).value
         
         base_structs = []
         members = []
         nested_structs = []
 
         # Handle forward declarations
-        if self.expect(TokenType.SEMICOLON):
+        if self.current_token.type is TT_SEMICOLON:
             self.advance()
             return StructDef(name, members, base_structs, nested_structs)
 
-        self.consume(TokenType.LEFT_BRACE)
+        self.consume(TT_LEFT_BRACE)
         
-        while not self.expect(TokenType.RIGHT_BRACE):
-            if self.expect(TokenType.PUBLIC):
-                self.advance()
-                self.consume(TokenType.LEFT_BRACE)
-                while not self.expect(TokenType.RIGHT_BRACE):
-                    if self.expect(TokenType.STRUCT):
-                        nested_struct = self.struct_def()
-                        nested_structs.append(nested_struct)
-                        self.consume(TokenType.SEMICOLON)
-                    else:
-                        member = self.struct_member()
-                        member.is_private = False
-                        members.append(member)
-                self.consume(TokenType.RIGHT_BRACE)
-                self.consume(TokenType.SEMICOLON)
-            elif self.expect(TokenType.PRIVATE):
-                self.advance()
-                self.consume(TokenType.LEFT_BRACE)
-                while not self.expect(TokenType.RIGHT_BRACE):
-                    if self.expect(TokenType.STRUCT):
-                        nested_struct = self.struct_def()
-                        nested_structs.append(nested_struct)
-                        self.consume(TokenType.SEMICOLON)
-                    else:
-                        member = self.struct_member()
-                        member.is_private = True
-                        members.append(member)
-                self.consume(TokenType.RIGHT_BRACE)
-                self.consume(TokenType.SEMICOLON)
-            elif self.expect(TokenType.STRUCT):
-                # Handle nested struct
-                nested_struct = self.struct_def()
-                nested_structs.append(nested_struct)
-                # Allow both with and without semicolon for nested structs
-                if self.expect(TokenType.SEMICOLON):
-                    self.advance()
+        while types[self.position] not in BLOCK_END_TOKENS:
+            if self.expect_any(ACCESS_SPECIFIERS):
+                self.access_block(self.struct_body_item, members, nested_structs)
             else:
-                members.append(self.struct_member())
+                self.struct_body_item(False, members, nested_structs)
         
-        self.consume(TokenType.RIGHT_BRACE)
+        self.consume(TT_RIGHT_BRACE)
         # Make semicolon optional after struct definition
-        if self.expect(TokenType.SEMICOLON):
+        if self.current_token.type is TT_SEMICOLON:
             self.advance()
         return StructDef(name, members, base_structs, nested_structs)
     
@@ -362,24 +581,24 @@ class FluxParser:
         """
         struct_member -> type_spec IDENTIFIER ';' // OR STRUCT, for nested
         """
-        if self.expect(TokenType.STRUCT):
+        if self.current_token.type is TT_STRUCT:
             self.advance()
-            name = self.consume(TokenType.IDENTIFIER).value
-            self.consume(TokenType.SEMICOLON)
+            name = self.consume(TT_IDENTIFIER).value
+            self.consume(TT_SEMICOLON)
             # Create a dummy type spec for the forward declaration
             type_spec = TypeSpec(name, is_signed=True)  # Using name as base_type
             return StructMember(name, type_spec)
 
         type_spec = self.type_spec()
-        name = self.consume(TokenType.IDENTIFIER).value
+        name = self.consume(TT_IDENTIFIER).value
         
         # Handle optional initial value
         initial_value = None
-        if self.expect(TokenType.ASSIGN):
+        if self.current_token.type is TT_ASSIGN:
             self.advance()
             initial_value = self.expression()
         
-        self.consume(TokenType.SEMICOLON)
+        self.consume(TT_SEMICOLON)
         return StructMember(name, type_spec, initial_value)
     
     def object_def(self) -> ObjectDef:
@@ -387,8 +606,9 @@ class FluxParser:
         object_def -> 'object' IDENTIFIER '{' object_body '}'
         object_body -> (object_member | access_specifier)*
         """
-        self.consume(TokenType.OBJECT)
-        name = self.consume(TokenType.IDENTIFIER).value
+        types = self.types
+        self.consume(TT_OBJECT)
+        name = self.consume(TT_IDENTIFIER).value
 
         
         # Parse inheritance -- TODO, impelment after we have v1 Flux base
@@ -405,73 +625,85 @@ class FluxParser:
         nested_objects = []
         nested_structs = []
 
-        if self.expect(TokenType.SEMICOLON):
+        if self.current_token.type is TT_SEMICOLON:
             is_prototype = True
             self.advance()
             return ObjectDef(name, methods, members, nested_objects, nested_structs)
 
-        self.consume(TokenType.LEFT_BRACE)
+        self.consume(TT_LEFT_BRACE)
         
-        while not self.expect(TokenType.RIGHT_BRACE):
-            if self.expect(TokenType.PUBLIC, TokenType.PRIVATE):
-                is_private = self.current_token.type == TokenType.PRIVATE
-                self.advance()
-                self.consume(TokenType.LEFT_BRACE)
-                
-                while not self.expect(TokenType.RIGHT_BRACE):
-                    if self.expect(TokenType.DEF):
-                        method = self.function_def()
-                        method.is_private = is_private
-                        methods.append(method)
-                    elif self.expect(TokenType.OBJECT):
-                        nested_obj = self.object_def()
-                        nested_obj.is_private = is_private
-                        nested_objects.append(nested_obj)
-                        self.consume(TokenType.SEMICOLON)
-                    elif self.expect(TokenType.STRUCT):
-                        nested_struct = self.struct_def()
-                        nested_struct.is_private = is_private
-                        nested_structs.append(nested_struct)
-                        self.consume(TokenType.SEMICOLON)
-                    else:
-                        # Field declaration
-                        var = self.variable_declaration()
-                        self.consume(TokenType.SEMICOLON)
-                        member = StructMember(var.name, var.type_spec, var.initial_value, is_private)
-                        members.append(member)
-                
-                self.consume(TokenType.RIGHT_BRACE)
-                self.consume(TokenType.SEMICOLON)
+        while types[self.position] not in BLOCK_END_TOKENS:
+            if self.expect_any(ACCESS_SPECIFIERS):
+                self.access_block(self.object_body_item, methods, members, nested_objects, nested_structs)
             else:
                 # Regular member (defaults to public)
-                if self.expect(TokenType.DEF):
-                    method = self.function_def()
-                    methods.append(method)
-                elif self.expect(TokenType.OBJECT):
-                    nested_obj = self.object_def()
-                    nested_objects.append(nested_obj)
-                    self.consume(TokenType.SEMICOLON)
-                elif self.expect(TokenType.STRUCT):
-                    nested_struct = self.struct_def()
-                    nested_structs.append(nested_struct)
-                    self.consume(TokenType.SEMICOLON)
-                else:
-                    # Field declaration
-                    var = self.variable_declaration()
-                    self.consume(TokenType.SEMICOLON)
-                    member = StructMember(var.name, var.type_spec, var.initial_value, False)
-                    members.append(member)
-        
-        self.consume(TokenType.RIGHT_BRACE)
-        self.consume(TokenType.SEMICOLON)
+                self.object_body_item(False, methods, members, nested_objects, nested_structs)
+        
+        self.consume(TT_RIGHT_BRACE)
+        self.consume(TT_SEMICOLON)
         return ObjectDef(name, methods, members, nested_objects, nested_structs)
     
+    def access_block(self, body_item, *collections) -> None:
+        """
+        access_block -> ('public' | 'private') '{' body_item* '}' ';'
+        """
+        types = self.types
+        is_private = self.current_token.type is TT_PRIVATE
+        self.advance()
+        self.consume(TT_LEFT_BRACE)
+        while types[self.position] not in BLOCK_END_TOKENS:
+            body_item(is_private, *collections)
+        self.consume(TT_RIGHT_BRACE)
+        self.consume(TT_SEMICOLON)
+    
+    def struct_body_item(self, is_private, members, nested_structs) -> None:
+        """
+        struct_body_item -> struct_def ';'? | struct_member
+        """
+        if self.current_token.type is TT_STRUCT:
+            nested_struct = self.struct_def()
+            nested_struct.is_private = is_private
+            nested_structs.append(nested_struct)
+            # Allow both with and without semicolon for nested structs
+            if self.current_token.type is TT_SEMICOLON:
+                self.advance()
+        else:
+            member = self.struct_member()
+            member.is_private = is_private
+            members.append(member)
+    
+    def object_body_item(self, is_private, methods, members, nested_objects, nested_structs) -> None:
+        """
+        object_body_item -> function_def | object_def ';' | struct_def ';' | variable_declaration ';'
+        """
+        token_type = self.current_token.type
+        if token_type is TT_DEF:
+            method = self.function_def()
+            method.is_private = is_private
+            methods.append(method)
+        elif token_type is TT_OBJECT:
+            nested_obj = self.object_def()
+            nested_obj.is_private = is_private
+            nested_objects.append(nested_obj)
+            self.consume(TT_SEMICOLON)
+        elif token_type is TT_STRUCT:
+            nested_struct = self.struct_def()
+            nested_struct.is_private = is_private
+            nested_structs.append(nested_struct)
+            self.consume(TT_SEMICOLON)
+        else:
+            # Field declaration
+            var = self.variable_declaration()
+            self.consume(TT_SEMICOLON)
+            members.append(StructMember(var.name, var.type_spec, var.initial_value, is_private))
+    
     def namespace_def(self) -> NamespaceDef:
         """
         namespace_def -> 'namespace' IDENTIFIER  '{' namespace_body* '}'
         """
-        self.consume(TokenType.NAMESPACE)
-        name = self.consume(TokenType.IDENTIFIER).value
+        types = self.types
+        self.consume(TT_NAMESPACE)
+        name = self.consume(TT_IDENTIFIER).value
         
         # INHERITANCE - TODO after v1 Flux
         base_namespaces = []
@@ -488,30 +720,30 @@ class FluxParser:
         variables = []
         nested_namespaces = []
 
-        if self.expect(TokenType.SEMICOLON):
+        if self.current_token.type is TT_SEMICOLON:
             self.advance()
             return NamespaceDef(name, functions, structs, objects, variables, nested_namespaces, base_namespaces)
 
-        self.consume(TokenType.LEFT_BRACE)
+        self.consume(TT_LEFT_BRACE)
         
-        while not self.expect(TokenType.RIGHT_BRACE):
-            if self.expect(TokenType.DEF):
+        while types[self.position] not in BLOCK_END_TOKENS:
+            if self.current_token.type is TT_DEF:
                 functions.append(self.function_def())
-            elif self.expect(TokenType.STRUCT):
+            elif self.current_token.type is TT_STRUCT:
                 structs.append(self.struct_def())
-            elif self.expect(TokenType.OBJECT):
+            elif self.current_token.type is TT_OBJECT:
                 objects.append(self.object_def())
-            elif self.expect(TokenType.NAMESPACE):
+            elif self.current_token.type is TT_NAMESPACE:
                 nested_namespaces.append(self.namespace_def())
             elif self.is_variable_declaration():
                 var_decl = self.variable_declaration()
                 variables.append(var_decl)
-                self.consume(TokenType.SEMICOLON)
+                self.consume(TT_SEMICOLON)
             else:
                 self.error("Expected function, struct, object, namespace, or variable declaration")
         
-        self.consume(TokenType.RIGHT_BRACE)
-        self.consume(TokenType.SEMICOLON)
+        self.consume(TT_RIGHT_BRACE)
+        self.consume(TT_SEMICOLON)
         return NamespaceDef(name, functions, structs, objects, variables, nested_namespaces, base_namespaces)
     
     def type_spec(self) -> TypeSpec:
@@ -522,22 +754,23 @@ class FluxParser:
         is_volatile = False
         is_signed = True
 
+        # Most type specs start directly with the base type
+        if self.current_token.type in TYPE_QUALIFIERS:
+            if self.current_token.type is TT_CONST:
+                is_const = True
+                self.advance()
+            
+            if self.current_token.type is TT_VOLATILE:
+                is_volatile = True
+                self.advance()
+            
+            if self.current_token.type is TT_SIGNED:
+                is_signed = True
+                self.advance()
 
-        if self.expect(TokenType.CONST):
-            is_const = True
-            self.advance()
-        
-        if self.expect(TokenType.VOLATILE):
-            is_volatile = True
-            self.advance()
-        
-        if self.expect(TokenType.SIGNED):
-            is_signed = True
-            self.advance()
-
-        elif self.expect(TokenType.UNSIGNED):
-            is_signed = False
-            self.advance()
+            elif self.current_token.type is TT_UNSIGNED:
+                is_signed = False
+                self.advance()
         
         # Base type
         base_type = self.base_type()
@@ -546,151 +779,148 @@ class FluxParser:
         bit_width = None
         alignment = None
         
-        if base_type == DataType.DATA and self.expect(TokenType.LEFT_BRACE):
+        if base_type == DT_DATA and self.current_token.type is TT_LEFT_BRACE:
             self.advance()
-            bit_width = int(self.consume(TokenType.INTEGER).value, 0)
+            bit_width = self.integer()
             
-            if self.expect(TokenType.COLON):
+            if self.current_token.type is TT_COLON:
                 self.advance()
-                alignment = int(self.consume(TokenType.INTEGER).value, 0)
+                alignment = self.integer()
             
-            self.consume(TokenType.RIGHT_BRACE)
+            self.consume(TT_RIGHT_BRACE)
         
         # Array specification
         is_array = False
         array_size = None
         
-        if self.expect(TokenType.LEFT_BRACKET):
+        if self.current_token.type is TT_LEFT_BRACKET:
             is_array = True
             self.advance()
-            if not self.expect(TokenType.RIGHT_BRACKET):
-                array_size = int(self.consume(TokenType.INTEGER).value, 0)
-            self.consume(TokenType.RIGHT_BRACKET)
+            if self.current_token.type is not TT_RIGHT_BRACKET:
+                array_size = self.integer()
+            self.consume(TT_RIGHT_BRACKET)
         
         # Pointer specification
         is_pointer = False
-        if self.expect(TokenType.MULTIPLY):
+        if self.current_token.type is TT_MULTIPLY:
             is_pointer = True
             self.advance()
         
-        return TypeSpec(base_type, is_signed, is_const, is_volatile, 
-                       bit_width, alignment, is_array, array_size, is_pointer)
+        return make_type_spec(base_type, is_signed, is_const, is_volatile,
+                              bit_width, alignment, is_array, array_size, is_pointer)
     
     def base_type(self) -> DataType:
         """
         base_type -> 'int' | 'float' | 'char' | 'bool' | 'data' | 'void' | IDENTIFIER
         """
-        if self.expect(TokenType.INT):
-            self.advance()
-            return DataType.INT
-        elif self.expect(TokenType.FLOAT_KW):
-            self.advance()
-            return DataType.FLOAT
-        elif self.expect(TokenType.CHAR):
-            self.advance()
-            return DataType.CHAR
-        elif self.expect(TokenType.BOOL_KW):
-            self.advance()
-            return DataType.BOOL
-        elif self.expect(TokenType.DATA):
-            self.advance()
-            return DataType.DATA
-        elif self.expect(TokenType.VOID):
-            self.advance()
-            return DataType.VOID
-        elif self.expect(TokenType.THIS):
-            self.advance()
-            return DataType.THIS
-        # Fixed-width integer types
-        elif self.expect(TokenType.UINT8):
-            self.advance()
-            return DataType.UINT8
-        elif self.expect(TokenType.UINT16):
-            self.advance()
-            return DataType.UINT16
-        elif self.expect(TokenType.UINT32):
-            self.advance()
-            return DataType.UINT32
-        elif self.expect(TokenType.UINT64):
-            self.advance()
-            return DataType.UINT64
-        elif self.expect(TokenType.INT8):
-            self.advance()
-            return DataType.INT8
-        elif self.expect(TokenType.INT16):
-            self.advance()
-            return DataType.INT16
-        elif self.expect(TokenType.INT32):
-            self.advance()
-            return DataType.INT32
-        elif self.expect(TokenType.INT64):
-            self.advance()
-            return DataType.INT64
-        elif self.expect(TokenType.IDENTIFIER):
-            # Custom type - for now treat as DATA
-            self.advance()
-            return DataType.DATA
-        else:
+        data_type = BASE_TYPES.get(self.current_token.type)
+        if data_type is None:
             self.error("Expected type specifier")
+        self.advance()
+        return data_type
     
     def is_variable_declaration(self) -> bool:
-        """Check if current position starts a variable declaration"""
-        saved_pos = self.position
-        try:
-            # Skip type specifiers
-            if self.expect(TokenType.CONST):
-                self.advance()
-            if self.expect(TokenType.VOLATILE):
-                self.advance()
-            if self.expect(TokenType.SIGNED, TokenType.UNSIGNED):
-                self.advance()
-            
-            # Must have a base type
-            if not self.expect(TokenType.INT, TokenType.FLOAT_KW, TokenType.CHAR, 
-                             TokenType.BOOL_KW, TokenType.DATA, TokenType.VOID, 
-                             TokenType.IDENTIFIER, TokenType.UINT8, TokenType.UINT16,
-                             TokenType.UINT32, TokenType.UINT64, TokenType.INT8,
-                             TokenType.INT16, TokenType.INT32, TokenType.INT64):
-                return False
-            
-            self.advance()
-            
-            # Skip data type specification
-            if self.expect(TokenType.LEFT_BRACE):
-                self.advance()
-                if self.expect(TokenType.INTEGER):
-                    self.advance()
-                if self.expect(TokenType.COLON):
-                    self.advance()
-                    if self.expect(TokenType.INTEGER):
-                        self.advance()
-                if self.expect(TokenType.RIGHT_BRACE):
-                    self.advance()
-            
-            # Skip array specification
-            if self.expect(TokenType.LEFT_BRACKET):
-                self.advance()
-                if self.expect(TokenType.INTEGER):
-                    self.advance()
-                if self.expect(TokenType.RIGHT_BRACKET):
-                    self.advance()
-            
-            # Skip pointer
-            if self.expect(TokenType.MULTIPLY):
-                self.advance()
-            
-            # Must have identifier or 'as' keyword
-            return self.expect(TokenType.IDENTIFIER, TokenType.AS)
-        finally:
-            self.position = saved_pos
-            self.current_token = self.tokens[self.position] if self.position < len(self.tokens) else None
+        """
+        Check if current position starts a variable declaration.
+        Peeks at the token types by index and never moves the parser; the EOF
+        token ends every token list and matches none of the checks below.
+        """
+        types = self.types
+        i = self.position
+
+        # Skip type specifiers
+        if types[i] in TYPE_QUALIFIERS:
+            if types[i] is TT_CONST:
+                i += 1
+            if types[i] is TT_VOLATILE:
+                i += 1
+            if types[i] in SIGN_SPECIFIERS:
+                i += 1
+        
+        # Must have a base type
+        if types[i] not in BASE_TYPE_TOKENS:
+            return False
+        i += 1
+        
+        # Skip data type specification
+        if types[i] is TT_LEFT_BRACE:
+            i += 1
+            if types[i] is TT_INTEGER:
+                i += 1
+            if types[i] is TT_COLON:
+                i += 1
+                if types[i] is TT_INTEGER:
+                    i += 1
+            if types[i] is TT_RIGHT_BRACE:
+                i += 1
+        
+        # Skip array specification
+        if types[i] is TT_LEFT_BRACKET:
+            i += 1
+            if types[i] is TT_INTEGER:
+                i += 1
+            if types[i] is TT_RIGHT_BRACKET:
+                i += 1
+        
+        # Skip pointer
+        if types[i] is TT_MULTIPLY:
+            i += 1
+        
+        # Must have identifier or 'as' keyword
+        return types[i] in DECLARATOR_TOKENS
+    
+    def type_spec_end(self, i: int) -> int:
+        """
+        Return the index just past a type_spec starting at token index i, or -1
+        if the tokens there are not one. Mirrors type_spec() on the token types
+        without moving the parser or building nodes.
+        """
+        types = self.types
+        if types[i] is TT_CONST:
+            i += 1
+        if types[i] is TT_VOLATILE:
+            i += 1
+        if types[i] in SIGN_SPECIFIERS:
+            i += 1
+        
+        base_type = BASE_TYPES.get(types[i])
+        if base_type is None:
+            return -1
+        i += 1
+        
+        # Bit width and alignment for data types
+        if base_type is DT_DATA and types[i] is TT_LEFT_BRACE:
+            if types[i + 1] is not TT_INTEGER:
+                return -1
+            i += 2
+            if types[i] is TT_COLON:
+                if types[i + 1] is not TT_INTEGER:
+                    return -1
+                i += 2
+            if types[i] is not TT_RIGHT_BRACE:
+                return -1
+            i += 1
+        
+        # Array specification
+        if types[i] is TT_LEFT_BRACKET:
+            i += 1
+            if types[i] is TT_INTEGER:
+                i += 1
+            if types[i] is not TT_RIGHT_BRACKET:
+                return -1
+            i += 1
+        
+        # Pointer specification
+        if types[i] is TT_MULTIPLY:
+            i += 1
+        return i
     
     def variable_declaration_statement(self) -> Statement:
         """
         variable_declaration_statement -> variable_declaration ';'
         """
         decl = self.variable_declaration()
-        self.consume(TokenType.SEMICOLON)
+        self.consume(TT_SEMICOLON)
         return ExpressionStatement(decl) if isinstance(decl, VariableDeclaration) else decl
     
     def variable_declaration(self) -> Union[VariableDeclaration, TypeDeclaration]:
@@ -698,33 +928,34 @@ class FluxParser:
         variable_declaration -> type_spec IDENTIFIER ('=' expression)?
                              | type_spec 'as' IDENTIFIER ('=' expression)?
         """
+        types = self.types
         type_spec = self.type_spec()
 
         # Check if this is a type declaration (using 'as')
-        if self.expect(TokenType.AS):
+        if self.current_token.type is TT_AS:
             self.advance()
-            type_name = self.consume(TokenType.IDENTIFIER).value
+            type_name = self.consume(TT_IDENTIFIER).value
             
             # Optional initial value
             initial_value = None
-            if self.expect(TokenType.ASSIGN):
+            if self.current_token.type is TT_ASSIGN:
                 self.advance()
                 initial_value = self.expression()
             
             return TypeDeclaration(type_name, type_spec, initial_value)
         else:
             # Regular variable declaration
-            name = self.consume(TokenType.IDENTIFIER).value
+            name = self.consume(TT_IDENTIFIER).value
             
             # Handle comma-separated variables
             names = [name]
-            while self.expect(TokenType.COMMA):
+            while types[self.position] is TT_COMMA:
                 self.advance()
-                names.append(self.consume(TokenType.IDENTIFIER).value)
+                names.append(self.consume(TT_IDENTIFIER).value)
             
             # Optional initial value (only for last variable)
             initial_value = None
-            if self.expect(TokenType.ASSIGN):
+            if self.current_token.type is TT_ASSIGN:
                 self.advance()
                 initial_value = self.expression()
             
@@ -741,15 +972,21 @@ class FluxParser:
         """
         block -> '{' statement* '}'
         """
-        self.consume(TokenType.LEFT_BRACE)
+        types = self.types
+        self.consume(TT_LEFT_BRACE)
         statements = []
-        
-        while not self.expect(TokenType.RIGHT_BRACE):
-            stmt = self.statement()
-            if stmt:
-                statements.append(stmt)
-        
-        self.consume(TokenType.RIGHT_BRACE)
+        append = statements.append
+        rules = STATEMENT_RULES.get
+        
+        while types[self.position] not in BLOCK_END_TOKENS:
+            # Keyword-led statements go straight to their rule; declarations and
+            # expressions take the full statement() path
+            rule = rules(types[self.position])
+            stmt = rule(self) if rule is not None else self.statement()
+            if stmt is not None:
+                append(stmt)
+        
+        self.consume(TT_RIGHT_BRACE)
         return Block(statements)
 
     def asm_statement(self) -> ExpressionStatement:
@@ -758,24 +995,38 @@ class FluxParser:
         """
         # Check for volatile keyword
         is_volatile = False
-        if self.expect(TokenType.VOLATILE):
+        if self.current_token.type is TT_VOLATILE:
             is_volatile = True
             self.advance()
         
-        self.consume(TokenType.ASM)
-        self.consume(TokenType.LEFT_BRACE)
+        self.consume(TT_ASM)
+        self.consume(TT_LEFT_BRACE)
         
-        # Collect assembly tokens
-        asm_tokens = []
-        while not self.expect(TokenType.RIGHT_BRACE):
-            asm_tokens.append(self.current_token.value)
-            self.advance()
+        # Collect assembly tokens up to the matching closing brace in one scan
+        # over the token types; braces inside the body (e.g. AVX-512 '{k1}') nest
+        tokens = self.tokens
+        types = self.types
+        start = end = self.position
+        depth = 0
+        while True:
+            token_type = types[end]
+            if token_type is TT_RIGHT_BRACE:
+                if not depth:
+                    break
+                depth -= 1
+            elif token_type is TT_LEFT_BRACE:
+                depth += 1
+            elif token_type is TT_EOF:
+                break
+            end += 1
+        asm_body = ' '.join([token.value for token in tokens[start:end]])
+        self.seek(end)
         
-        self.consume(TokenType.RIGHT_BRACE)
-        self.consume(TokenType.SEMICOLON)
+        self.consume(TT_RIGHT_BRACE)
+        self.consume(TT_SEMICOLON)
         
         return ExpressionStatement(InlineAsm(
-            body=' '.join(asm_tokens),
+            body=asm_body,
             is_volatile=is_volatile
         ))
     
@@ -783,120 +1034,108 @@ class FluxParser:
         """
         if_statement -> 'if' '(' expression ')' block ('elif' '(' expression ')' block)* ('else' block)? ';'
         """
-        self.consume(TokenType.IF)
-        self.consume(TokenType.LEFT_PAREN)
+        self.consume(TT_IF)
+        self.consume(TT_LEFT_PAREN)
         condition = self.expression()
-        self.consume(TokenType.RIGHT_PAREN)
+        self.consume(TT_RIGHT_PAREN)
         then_block = self.block()
         
         elif_blocks = []
-        while self.expect(TokenType.ELIF):
+        while self.current_token.type is TT_ELIF:
             self.advance()
-            self.consume(TokenType.LEFT_PAREN)
+            self.consume(TT_LEFT_PAREN)
             elif_condition = self.expression()
-            self.consume(TokenType.RIGHT_PAREN)
+            self.consume(TT_RIGHT_PAREN)
             elif_block = self.block()
             elif_blocks.append((elif_condition, elif_block))
         
         else_block = None
-        if self.expect(TokenType.ELSE):
+        if self.current_token.type is TT_ELSE:
             self.advance()
             else_block = self.block()
         
-        self.consume(TokenType.SEMICOLON)
+        self.consume(TT_SEMICOLON)
         return IfStatement(condition, then_block, elif_blocks, else_block)
     
     def while_statement(self) -> WhileLoop:
         """
         while_statement -> 'while' '(' expression ')' block ';'
         """
-        self.consume(TokenType.WHILE)
-        self.consume(TokenType.LEFT_PAREN)
+        self.consume(TT_WHILE)
+        self.consume(TT_LEFT_PAREN)
         condition = self.expression()
-        self.consume(TokenType.RIGHT_PAREN)
+        self.consume(TT_RIGHT_PAREN)
         body = self.block()
-        self.consume(TokenType.SEMICOLON)
+        self.consume(TT_SEMICOLON)
         return WhileLoop(condition, body)
     
     def do_while_statement(self) -> DoWhileLoop:
         """
         do_while_statement -> 'do' block 'while' '(' expression ')' ';'
         """
-        self.consume(TokenType.DO)
+        self.consume(TT_DO)
         body = self.block()
-        self.consume(TokenType.WHILE)
-        self.consume(TokenType.LEFT_PAREN)
+        self.consume(TT_WHILE)
+        self.consume(TT_LEFT_PAREN)
         condition = self.expression()
-        self.consume(TokenType.RIGHT_PAREN)
-        self.consume(TokenType.SEMICOLON)
+        self.consume(TT_RIGHT_PAREN)
+        self.consume(TT_SEMICOLON)
         return DoWhileLoop(body, condition)
     
     def for_statement(self) -> Union[ForLoop, ForInLoop]:
         """
         for_statement -> 'for' '(' (for_in_loop | for_c_loop) ')' block ';'
         """
-        self.consume(TokenType.FOR)
-        self.consume(TokenType.LEFT_PAREN)
-        
-        # Check if it's a for-in loop by looking ahead
-        saved_pos = self.position
-        is_for_in = False
-        
-        # Look for pattern: identifier (',' identifier)* 'in' expression
-        if self.expect(TokenType.IDENTIFIER):
-            self.advance()
-            while self.expect(TokenType.COMMA):
-                self.advance()
-                if self.expect(TokenType.IDENTIFIER):
-                    self.advance()
-                else:
-                    break
-            if self.expect(TokenType.IN):
-                is_for_in = True
-        
-        # Restore position
-        self.position = saved_pos
-        self.current_token = self.tokens[self.position]
+        types = self.types
+        self.consume(TT_FOR)
+        self.consume(TT_LEFT_PAREN)
         
-        if is_for_in:
+        # Check for the for-in pattern identifier (',' identifier)* 'in' by index,
+        # collecting the names on the way so the list is only read once
+        tokens = self.tokens
+        i = self.position
+        variables = []
+        if types[i] is TT_IDENTIFIER:
+            variables.append(tokens[i].value)
+            i += 1
+            while types[i] is TT_COMMA and types[i + 1] is TT_IDENTIFIER:
+                variables.append(tokens[i + 1].value)
+                i += 2
+        
+        if variables and types[i] is TT_IN:
             # for-in loop
-            variables = []
-            variables.append(self.consume(TokenType.IDENTIFIER).value)
-            
-            while self.expect(TokenType.COMMA):
-                self.advance()
-                variables.append(self.consume(TokenType.IDENTIFIER).value)
+            self.seek(i)
             
-            self.consume(TokenType.IN)
+            self.consume(TT_IN)
             iterable = self.expression()
-            self.consume(TokenType.RIGHT_PAREN)
+            self.consume(TT_RIGHT_PAREN)
             body = self.block()
-            self.consume(TokenType.SEMICOLON)
+            self.consume(TT_SEMICOLON)
             
             return ForInLoop(variables, iterable, body)
         else:
             # C-style for loop
             init = None
-            if not self.expect(TokenType.SEMICOLON):
+            if self.current_token.type is not TT_SEMICOLON:
                 if self.is_variable_declaration():
                     init = ExpressionStatement(self.variable_declaration())
                 else:
                     init = self.expression_statement()
             else:
-                self.consume(TokenType.SEMICOLON)
+                self.consume(TT_SEMICOLON)
             
             condition = None
-            if not self.expect(TokenType.SEMICOLON):
+            if self.current_token.type is not TT_SEMICOLON:
                 condition = self.expression()
-            self.consume(TokenType.SEMICOLON)
+            self.consume(TT_SEMICOLON)
             
             update = None
-            if not self.expect(TokenType.RIGHT_PAREN):
+            if self.current_token.type is not TT_RIGHT_PAREN:
                 update = self.expression_statement()
             
-            self.consume(TokenType.RIGHT_PAREN)
+            self.consume(TT_RIGHT_PAREN)
             body = self.block()
-            self.consume(TokenType.SEMICOLON)
+            self.consume(TT_SEMICOLON)
             
             return ForLoop(init, condition, update, body)
     
@@ -904,19 +1143,20 @@ class FluxParser:
         """
         switch_statement -> 'switch' '(' expression ')' '{' switch_case* '}' ';'
         """
-        self.consume(TokenType.SWITCH)
-        self.consume(TokenType.LEFT_PAREN)
+        types = self.types
+        self.consume(TT_SWITCH)
+        self.consume(TT_LEFT_PAREN)
         expression = self.expression()
-        self.consume(TokenType.RIGHT_PAREN)
-        self.consume(TokenType.LEFT_BRACE)
+        self.consume(TT_RIGHT_PAREN)
+        self.consume(TT_LEFT_BRACE)
         
         cases = []
-        while not self.expect(TokenType.RIGHT_BRACE):
+        while types[self.position] not in BLOCK_END_TOKENS:
             case = self.switch_case()
             cases.append(case)
         
-        self.consume(TokenType.RIGHT_BRACE)
-        self.consume(TokenType.SEMICOLON)
+        self.consume(TT_RIGHT_BRACE)
+        self.consume(TT_SEMICOLON)
         return SwitchStatement(expression, cases)
     
     def switch_case(self) -> Case:
@@ -924,102 +1164,102 @@ class FluxParser:
         switch_case -> ('case' '(' expression ')' | 'default' '{' statement* '}' ';') block
         """
         value = None
-        if self.expect(TokenType.CASE):
+        if self.current_token.type is TT_CASE:
             self.advance()
-            self.consume(TokenType.LEFT_PAREN)
+            self.consume(TT_LEFT_PAREN)
             value = self.expression()
-            self.consume(TokenType.RIGHT_PAREN)
-        elif self.expect(TokenType.DEFAULT):
+            self.consume(TT_RIGHT_PAREN)
+        elif self.current_token.type is TT_DEFAULT:
             self.advance()
             value = None
         else:
             self.error("Expected 'case' or 'default'")
         
         body = self.block()
-        self.consume(TokenType.SEMICOLON)
+        self.consume(TT_SEMICOLON)
         return Case(value, body)
     
     def try_statement(self) -> TryBlock:
         """
         try_statement -> 'try' block catch_block+ ';'
         """
-        self.consume(TokenType.TRY)
+        self.consume(TT_TRY)
         try_body = self.block()
         
         catch_blocks = []
-        while self.expect(TokenType.CATCH):
+        while self.current_token.type is TT_CATCH:
             self.advance()
-            self.consume(TokenType.LEFT_PAREN)
+            self.consume(TT_LEFT_PAREN)
             
             # Exception type and name
-            if self.expect(TokenType.AUTO):
+            if self.current_token.type is TT_AUTO:
                 self.advance()
                 exception_type = None
-                exception_name = self.consume(TokenType.IDENTIFIER).value
+                exception_name = self.consume(TT_IDENTIFIER).value
             else:
                 exception_type = self.type_spec()
-                exception_name = self.consume(TokenType.IDENTIFIER).value
+                exception_name = self.consume(TT_IDENTIFIER).value
             
-            self.consume(TokenType.RIGHT_PAREN)
+            self.consume(TT_RIGHT_PAREN)
             catch_body = self.block()
             catch_blocks.append((exception_type, exception_name, catch_body))
         
-        self.consume(TokenType.SEMICOLON)
+        self.consume(TT_SEMICOLON)
         return TryBlock(try_body, catch_blocks)
     
     def return_statement(self) -> ReturnStatement:
         """
         return_statement -> 'return' expression? ';'
         """
-        self.consume(TokenType.RETURN)
+        self.consume(TT_RETURN)
         value = None
-        if not self.expect(TokenType.SEMICOLON):
+        if self.current_token.type is not TT_SEMICOLON:
             value = self.expression()
-        self.consume(TokenType.SEMICOLON)
+        self.consume(TT_SEMICOLON)
         return ReturnStatement(value)
     
     def break_statement(self) -> BreakStatement:
         """
         break_statement -> 'break' ';'
         """
-        self.consume(TokenType.BREAK)
-        self.consume(TokenType.SEMICOLON)
+        self.consume(TT_BREAK)
+        self.consume(TT_SEMICOLON)
         return BreakStatement()
     
     def continue_statement(self) -> ContinueStatement:
         """
         continue_statement -> 'continue' ';'
         """
-        self.consume(TokenType.CONTINUE)
-        self.consume(TokenType.SEMICOLON)
+        self.consume(TT_CONTINUE)
+        self.consume(TT_SEMICOLON)
         return ContinueStatement()
 
     def throw_statement(self) -> ThrowStatement:
         """
         throw_statement -> 'throw' '(' expression ')' ';'
         """
-        self.consume(TokenType.THROW)
-        self.consume(TokenType.LEFT_PAREN)
+        self.consume(TT_THROW)
+        self.consume(TT_LEFT_PAREN)
         expression = self.expression()
-        self.consume(TokenType.RIGHT_PAREN)
-        self.consume(TokenType.SEMICOLON)
+        self.consume(TT_RIGHT_PAREN)
+        self.consume(TT_SEMICOLON)
         return ThrowStatement(expression)
     
     def assert_statement(self) -> AssertStatement:
         """
         assert_statement -> 'assert' '(' expression (',' CHAR)? ')' ';'
         """
-        self.consume(TokenType.ASSERT)
-        self.consume(TokenType.LEFT_PAREN)
+        self.consume(TT_ASSERT)
+        self.consume(TT_LEFT_PAREN)
         condition = self.expression()
         
         message = None
-        if self.expect(TokenType.COMMA):
+        if self.current_token.type is TT_COMMA:
             self.advance()
-            message = self.consume(TokenType.CHAR).value
+            message = self.consume(TT_CHAR).value
         
-        self.consume(TokenType.RIGHT_PAREN)
-        self.consume(TokenType.SEMICOLON)
+        self.consume(TT_RIGHT_PAREN)
+        self.consume(TT_SEMICOLON)
         return AssertStatement(condition, message)
     
     def expression_statement(self) -> ExpressionStatement:
@@ -1027,188 +1267,79 @@ class FluxParser:
         expression_statement -> expression ';'
         """
         expr = self.expression()
-        self.consume(TokenType.SEMICOLON)
+        self.consume(TT_SEMICOLON)
         return ExpressionStatement(expr)
     
+    @memoize
     def expression(self) -> Expression:
         """
-        expression -> assignment_expression
-        """
-        return self.assignment_expression()
-    
-    def assignment_expression(self) -> Expression:
-        """
-        assignment_expression -> logical_or_expression ('=' assignment_expression)?
-        """
-        expr = self.logical_or_expression()
-        
-        if self.expect(TokenType.ASSIGN):
-            self.advance()
-            value = self.assignment_expression()
-            return Assignment(expr, value)
+        expression -> binary_expression ('=' expression)?
         
-        return expr
-    
-    def logical_or_expression(self) -> Expression:
+        Memoized once a cast_expression guess has failed after its operand
+        parsed, since the fallback parse re-enters expression() at the same
+        positions (or throughout with memoize=True).
         """
-        logical_or_expression -> logical_and_expression ('or' logical_and_expression)*
-        """
-        expr = self.logical_and_expression()
+        expr = self.binary_expression(1)
         
-        while self.expect(TokenType.OR):
-            operator = Operator.OR
+        if self.current_token.type is TT_ASSIGN:
             self.advance()
-            right = self.logical_and_expression()
-            expr = BinaryOp(expr, operator, right)
-        
-        return expr
-    
-    def logical_and_expression(self) -> Expression:
-        """
-        logical_and_expression -> logical_xor_expression ('and' equality_expression)*
-        """
-        expr = self.logical_xor_expression()
-        
-        while self.expect(TokenType.AND):
-            operator = Operator.AND
-            self.advance()
-            right = self.logical_xor_expression()
-            expr = BinaryOp(expr, operator, right)
-        
-        return expr
-
-    def logical_xor_expression(self) -> Expression:
-        """
-        logical_xor_expression -> equality_expression ('xor' equality_expression)*
-        """
-        expr = self.equality_expression()
-
-        while (self.expect(TokenType.XOR)):
-            operator = Operator.XOR
-            self.advance()
-            right = self.equality_expression()
-            expr = BianryOp(expr, operator, right)
-
-        return expr
-    
-    def equality_expression(self) -> Expression:
-        """
-        equality_expression -> relational_expression (('==' | '!=') relational_expression)*
-        """
-        expr = self.relational_expression()
-        
-        while self.expect(TokenType.EQUAL, TokenType.NOT_EQUAL):
-            if self.current_token.type == TokenType.EQUAL:
-                operator = Operator.EQUAL
-            elif self.current_token.type == TokenType.NOT_EQUAL:
-                operator = Operator.NOT_EQUAL
-            
-            self.advance()
-            right = self.relational_expression()
-            expr = BinaryOp(expr, operator, right)
-        
-        return expr
-    
-    def relational_expression(self) -> Expression:
-        """
-        relational_expression -> shift_expression (('<' | '<=' | '>' | '>=') shift_expression)*
-        """
-        expr = self.shift_expression()
-        
-        while self.expect(TokenType.LESS_EQUAL, TokenType.LESS_THAN, TokenType.LESS_EQUAL, TokenType.GREATER_THAN, TokenType.GREATER_EQUAL):
-            if self.current_token.type == TokenType.LESS_EQUAL:
-                operator = Operator.LESS_EQUAL, TokenType.LESS_THAN
-            elif self.current_token.type == TokenType.LESS_EQUAL:
-                operator = Operator.LESS_EQUAL
-            elif self.current_token.type == TokenType.GREATER_THAN:
-                operator = Operator.GREATER_THAN
-            else:  # GE
-                operator = Operator.GREATER_EQUAL
-            
-            self.advance()
-            right = self.shift_expression()
-            expr = BinaryOp(expr, operator, right)
+            value = self.expression()
+            return Assignment(expr, value)
         
         return expr
     
-    def shift_expression(self) -> Expression:
+    def binary_expression(self, min_power: int) -> Expression:
         """
-        shift_expression -> additive_expression (('<<' | '>>') additive_expression)*
-        """
-        expr = self.additive_expression()
+        binary_expression -> cast_expression (BINARY_OPERATOR binary_expression)*
         
-        while self.expect(TokenType.LESS_EQUAL, TokenType.LEFT_SHIFT, TokenType.RIGHT_SHIFT):
-            if self.current_token.type == TokenType.LESS_EQUAL:
-                operator = Operator.BITSHIFT_LEFT
-            else:  # RIGHT_SHIFT
-                operator = Operator.BITSHIFT_RIGHT
-            
-            self.advance()
-            right = self.additive_expression()
-            expr = BinaryOp(expr, operator, right)
-        
-        return expr
-    
-    def additive_expression(self) -> Expression:
-        """
-        additive_expression -> multiplicative_expression (('+' | '-') multiplicative_expression)*
+        Precedence climbing over BINARY_OPERATORS: one loop handles every
+        left-associative level from 'or' down to '*' '/' '%'.
         """
-        expr = self.multiplicative_expression()
-        
-        while self.expect(TokenType.PLUS, TokenType.MINUS):
-            if self.current_token.type == TokenType.PLUS:
-                operator = Operator.ADD
-            else:  # MINUS
-                operator = Operator.SUB
-            
-            self.advance()
-            right = self.multiplicative_expression()
-            expr = BinaryOp(expr, operator, right)
-        
-        return expr
+        return self.binary_operands(self.cast_expression(), min_power)
     
-    def multiplicative_expression(self) -> Expression:
-        """
-        multiplicative_expression -> cast_expression (('*' | '/' | '%') cast_expression)*
-        """
-        expr = self.cast_expression()
-        
-        while self.expect(TokenType.MULTIPLY, TokenType.DIVIDE, TokenType.MODULO):
-            if self.current_token.type == TokenType.MULTIPLY:
-                operator = Operator.MUL
-            elif self.current_token.type == TokenType.DIVIDE:
-                operator = Operator.DIV
-            else:  # MODULO
-                operator = Operator.MOD
-            
-            self.advance()
+    def binary_operands(self, expr: Expression, min_power: int) -> Expression:
+        """Fold the operators binding at least min_power onto a parsed left operand"""
+        while True:
+            entry = BINARY_OPERATORS.get(self.current_token.type)
+            if entry is None or entry[0] < min_power:
+                return expr
+            power, operator = entry
+            self.position += 1
+            self.current_token = self.tokens[self.position]
             right = self.cast_expression()
+            # Only climb when the next operator binds tighter, so a chain at
+            # one level takes no extra call per operand
+            entry = BINARY_OPERATORS.get(self.current_token.type)
+            if entry is not None and entry[0] > power:
+                right = self.binary_operands(right, power + 1)
             expr = BinaryOp(expr, operator, right)
-        
-        return expr
     
     def cast_expression(self) -> Expression:
         """
         cast_expression -> ('(' type_spec ')')? unary_expression
         """
-        if self.expect(TokenType.LEFT_PAREN):
-            # Look ahead to see if this is a cast
+        if self.current_token.type is TT_LEFT_PAREN:
+            # Look ahead by index: only '(' type_spec ')' followed by an operand
+            # can be a cast, so ordinary parenthesised expressions skip the attempt
+            types = self.types
             saved_pos = self.position
-            try:
-                self.advance()  # consume '('
-                target_type = self.type_spec()
-                if self.expect(TokenType.RIGHT_PAREN):
+            end = self.type_spec_end(saved_pos + 1)
+            if end != -1 and types[end] is TT_RIGHT_PAREN and types[end + 1] in UNARY_START_TOKENS:
+                try:
+                    self.advance()  # consume '('
+                    target_type = self.type_spec()
                     self.advance()  # consume ')'
                     expr = self.unary_expression()
                     return CastExpression(target_type, expr)
-                else:
-                    # Not a cast, restore position
-                    self.position = saved_pos
-                    self.current_token = self.tokens[self.position]
-            except:
-                # Not a cast, restore position
-                self.position = saved_pos
-                self.current_token = self.tokens[self.position]
+                except ParseError:
+                    # The operand did not parse (e.g. '(x)++'), so read it as a
+                    # parenthesised expression instead. That re-enters
+                    # expression() where the guess already did, so memoize from
+                    # here on; nested failed guesses would otherwise each double
+                    # the work
+                    if self.memo is None:
+                        self.memo = [None] * len(MEMO_RULES)
+                    self.seek(saved_pos)
         
         return self.unary_expression()
     
@@ -1217,41 +1348,48 @@ class FluxParser:
         unary_expression -> ('not' | '-' | '+' | '*' | '@' | '++' | '--') unary_expression
                          | postfix_expression
         """
-        if self.expect(TokenType.NOT):
-            operator = Operator.NOT
-            self.advance()
+        if self.current_token.type is TT_NOT:
+            operator = OP_NOT
+            self.position += 1
+            self.current_token = self.tokens[self.position]
             operand = self.unary_expression()
             return UnaryOp(operator, operand)
-        elif self.expect(TokenType.MINUS):
-            operator = Operator.SUB
-            self.advance()
+        elif self.current_token.type is TT_MINUS:
+            operator = OP_SUB
+            self.position += 1
+            self.current_token = self.tokens[self.position]
             operand = self.unary_expression()
             return UnaryOp(operator, operand)
-        elif self.expect(TokenType.PLUS):
-            operator = Operator.ADD
-            self.advance()
+        elif self.current_token.type is TT_PLUS:
+            operator = OP_ADD
+            self.position += 1
+            self.current_token = self.tokens[self.position]
             operand = self.unary_expression()
             return UnaryOp(operator, operand)
-        elif self.expect(TokenType.MULTIPLY):
+        elif self.current_token.type is TT_MULTIPLY:
             # Pointer dereference
-            self.advance()
+            self.position += 1
+            self.current_token = self.tokens[self.position]
             operand = self.unary_expression()
             return PointerDeref(operand)
-        elif self.expect(TokenType.ADDRESS_OF):
+        elif self.current_token.type is TT_ADDRESS_OF:
             # Address-of operator
-            self.advance()
+            self.position += 1
+            self.current_token = self.tokens[self.position]
             operand = self.unary_expression()
             return AddressOf(operand)
-        elif self.expect(TokenType.INCREMENT):
+        elif self.current_token.type is TT_INCREMENT:
             # Prefix increment
-            self.advance()
+            self.position += 1
+            self.current_token = self.tokens[self.position]
             operand = self.unary_expression()
-            return UnaryOp(Operator.INCREMENT, operand)
-        elif self.expect(TokenType.DECREMENT):
+            return UnaryOp(OP_INCREMENT, operand)
+        elif self.current_token.type is TT_DECREMENT:
             # Prefix decrement
-            self.advance()
+            self.position += 1
+            self.current_token = self.tokens[self.position]
             operand = self.unary_expression()
-            return UnaryOp(Operator.DECREMENT, operand)
+            return UnaryOp(OP_DECREMENT, operand)
         else:
             return self.postfix_expression()
     
@@ -1268,37 +1406,42 @@ class FluxParser:
         expr = self.primary_expression()
         
         while True:
-            if self.expect(TokenType.LEFT_BRACKET):
+            if self.current_token.type is TT_LEFT_BRACKET:
                 # Array access
-                self.advance()
+                self.position += 1
+                self.current_token = self.tokens[self.position]
                 index = self.expression()
-                self.consume(TokenType.RIGHT_BRACKET)
+                self.consume(TT_RIGHT_BRACKET)
                 expr = ArrayAccess(expr, index)
-            elif self.expect(TokenType.LEFT_PAREN):
+            elif self.current_token.type is TT_LEFT_PAREN:
                 # Function call
-                self.advance()
+                self.position += 1
+                self.current_token = self.tokens[self.position]
                 args = []
-                if not self.expect(TokenType.RIGHT_PAREN):
+                if self.current_token.type is not TT_RIGHT_PAREN:
                     args = self.argument_list()
-                self.consume(TokenType.RIGHT_PAREN)
+                self.consume(TT_RIGHT_PAREN)
                 if isinstance(expr, Identifier):
                     expr = FunctionCall(expr.name, args)
                 else:
                     # Method call or complex expression
                     expr = FunctionCall("", args)  # This might need refinement
-            elif self.expect(TokenType.DOT):
+            elif self.current_token.type is TT_DOT:
                 # Member access
-                self.advance()
-                member = self.consume(TokenType.IDENTIFIER).value
+                self.position += 1
+                self.current_token = self.tokens[self.position]
+                member = self.consume(TT_IDENTIFIER).value
                 expr = MemberAccess(expr, member)
-            elif self.expect(TokenType.INCREMENT):
+            elif self.current_token.type is TT_INCREMENT:
                 # Postfix increment
-                self.advance()
-                expr = UnaryOp(Operator.INCREMENT, expr, is_postfix=True)
-            elif self.expect(TokenType.DECREMENT):
+                self.position += 1
+                self.current_token = self.tokens[self.position]
+                expr = UnaryOp(OP_INCREMENT, expr, is_postfix=True)
+            elif self.current_token.type is TT_DECREMENT:
                 # Postfix decrement
-                self.advance()
-                expr = UnaryOp(Operator.DECREMENT, expr, is_postfix=True)
+                self.position += 1
+                self.current_token = self.tokens[self.position]
+                expr = UnaryOp(OP_DECREMENT, expr, is_postfix=True)
             else:
                 break
         
@@ -1308,9 +1451,10 @@ class FluxParser:
         """
         argument_list -> expression (',' expression)*
         """
+        types = self.types
         args = [self.expression()]
         
-        while self.expect(TokenType.COMMA):
+        while types[self.position] is TT_COMMA:
             self.advance()
             args.append(self.expression())
         
@@ -1332,200 +1476,243 @@ class FluxParser:
                            | array_literal
                            | struct_literal
         """
-        if self.expect(TokenType.IDENTIFIER):
-            name = self.current_token.value
-            self.advance()
-            return Identifier(name)
-        elif self.expect(TokenType.XOR):
-            # Handle XOR as a function call
-            self.advance()
-            self.consume(TokenType.LEFT_PAREN)
-            args = []
-            if not self.expect(TokenType.RIGHT_PAREN):
-                args = self.argument_list()
-            self.consume(TokenType.RIGHT_PAREN)
-            return FunctionCall("xor", args)
-        elif self.expect(TokenType.INTEGER):
-            value = int(self.current_token.value, 0)
-            self.advance()
-            return Literal(value, DataType.INT)
-        elif self.expect(TokenType.FLOAT):
-            value = float(self.current_token.value)
-            self.advance()
-            return Literal(value, DataType.FLOAT)
-        elif self.expect(TokenType.CHAR):
-            value = self.current_token.value
-            self.advance()
-            return Literal(value, DataType.CHAR)  # String as char array
-        elif self.expect(TokenType.STRING_LITERAL):
-            value = self.current_token.value
-            self.advance()
-            return Literal(value, DataType.CHAR)
-        elif self.expect(TokenType.TRUE):
-            self.advance()
-            return Literal(True, DataType.BOOL)
-        elif self.expect(TokenType.FALSE):
-            self.advance()
-            return Literal(False, DataType.BOOL)
-        elif self.expect(TokenType.VOID):
-            self.advance()
-            return Literal(None, DataType.VOID)
-        elif self.expect(TokenType.THIS):
-            self.advance()
-            return Identifier("this")
-        elif self.expect(TokenType.SUPER):
-            self.advance()
-            return Identifier("super")
-        elif self.expect(TokenType.LEFT_PAREN):
-            self.advance()
-            expr = self.expression()
-            self.consume(TokenType.RIGHT_PAREN)
-            return expr
-        elif self.expect(TokenType.LEFT_BRACKET):
-            return self.array_literal()
-        elif self.expect(TokenType.LEFT_BRACE):
-            return self.struct_literal()
-        if self.expect(TokenType.SIZEOF):
-            return self.sizeof_expression()
-        elif self.expect(TokenType.ALIGNOF):
-            return self.alignof_expression()
-        else:
-            self.error(f"Unexpected token: {self.current_token.type.name if self.current_token else 'EOF'}")
+        token = self.current_token
+        if token.type is TT_IDENTIFIER:
+            self.position += 1
+            self.current_token = self.tokens[self.position]
+            return Identifier(token.value)
+        rule = PRIMARY_RULES.get(token.type)
+        if rule is None:
+            self.error(f"Unexpected token: {token.type.name if token else 'EOF'}")
+        return rule(self)
+    
+    def xor_call(self) -> FunctionCall:
+        """
+        xor_call -> 'xor' '(' argument_list? ')'
+        """
+        self.position += 1
+        self.current_token = self.tokens[self.position]
+        self.consume(TT_LEFT_PAREN)
+        args = []
+        if self.current_token.type is not TT_RIGHT_PAREN:
+            args = self.argument_list()
+        self.consume(TT_RIGHT_PAREN)
+        return FunctionCall("xor", args)
+    
+    def integer_literal(self) -> Literal:
+        value = self.current_token.number
+        if value is None:
+            self.error(f"Invalid integer literal '{self.current_token.value}'")
+        self.position += 1
+        self.current_token = self.tokens[self.position]
+        return Literal(value, DT_INT)
+    
+    def float_literal(self) -> Literal:
+        value = self.current_token.number
+        self.position += 1
+        self.current_token = self.tokens[self.position]
+        return Literal(value, DT_FLOAT)
+    
+    def char_literal(self) -> Literal:
+        # Character and string literals are both char data
+        value = self.current_token.value
+        self.position += 1
+        self.current_token = self.tokens[self.position]
+        return Literal(value, DT_CHAR)
+    
+    def true_literal(self) -> Literal:
+        self.position += 1
+        self.current_token = self.tokens[self.position]
+        return Literal(True, DT_BOOL)
+    
+    def false_literal(self) -> Literal:
+        self.position += 1
+        self.current_token = self.tokens[self.position]
+        return Literal(False, DT_BOOL)
+    
+    def void_literal(self) -> Literal:
+        self.position += 1
+        self.current_token = self.tokens[self.position]
+        return Literal(None, DT_VOID)
+    
+    def keyword_identifier(self) -> Identifier:
+        """
+        keyword_identifier -> 'this' | 'super'
+        """
+        name = self.current_token.value
+        self.position += 1
+        self.current_token = self.tokens[self.position]
+        return Identifier(name)
+    
+    def parenthesized_expression(self) -> Expression:
+        """
+        parenthesized_expression -> '(' expression ')'
+        """
+        self.position += 1
+        self.current_token = self.tokens[self.position]
+        expr = self.expression()
+        self.consume(TT_RIGHT_PAREN)
+        return expr
     
     def alignof_expression(self) -> AlignOf:
         """
         alignof_expression -> 'alignof' '(' (type_spec | expression) ')'
         """
-        self.consume(TokenType.ALIGNOF)
-        self.consume(TokenType.LEFT_PAREN)
+        self.consume(TT_ALIGNOF)
+        self.consume(TT_LEFT_PAREN)
         
-        # Look ahead to determine if it's a type or expression
-        saved_pos = self.position
-        try:
-            # Try to parse as type spec first
+        # Look ahead to determine if it's a type or expression; a type spec
+        # followed directly by ')' is read as a type
+        end = self.type_spec_end(self.position)
+        if end != -1 and self.types[end] is TT_RIGHT_PAREN:
             target = self.type_spec()
-            self.consume(TokenType.RIGHT_PAREN)
-            return AlignOf(target)
-        except ParseError:
-            # If type parsing fails, try as expression
-            self.position = saved_pos
-            self.current_token = self.tokens[self.position]
-            expr = self.expression()
-            self.consume(TokenType.RIGHT_PAREN)
-            return AlignOf(expr)
+        else:
+            target = self.expression()
+        self.consume(TT_RIGHT_PAREN)
+        return AlignOf(target)
 
     def sizeof_expression(self) -> SizeOf:
         """
         sizeof_expression -> 'sizeof' '(' (type_spec | expression) ')'
         """
-        self.consume(TokenType.SIZEOF)
-        self.consume(TokenType.LEFT_PAREN)
+        self.consume(TT_SIZEOF)
+        self.consume(TT_LEFT_PAREN)
         
-        # Look ahead to determine if it's a type or expression
-        saved_pos = self.position
-        try:
-            # Try to parse as type spec first
+        # Look ahead to determine if it's a type or expression; a type spec
+        # followed directly by ')' is read as a type
+        end = self.type_spec_end(self.position)
+        if end != -1 and self.types[end] is TT_RIGHT_PAREN:
             target = self.type_spec()
-            self.consume(TokenType.RIGHT_PAREN)
-            return SizeOf(target)
-        except ParseError:
-            # If type parsing fails, try as expression
-            self.position = saved_pos
-            self.current_token = self.tokens[self.position]
-            expr = self.expression()
-            self.consume(TokenType.RIGHT_PAREN)
-            return SizeOf(expr)
+        else:
+            target = self.expression()
+        self.consume(TT_RIGHT_PAREN)
+        return SizeOf(target)
 
     def array_literal(self) -> Expression:
         """
         array_literal -> '[' (expression (',' expression)*)? ']'
         """
-        self.consume(TokenType.LEFT_BRACKET)
+        types = self.types
+        self.consume(TT_LEFT_BRACKET)
         elements = []
         
-        if not self.expect(TokenType.RIGHT_BRACKET):
+        if self.current_token.type is not TT_RIGHT_BRACKET:
             elements.append(self.expression())
-            while self.expect(TokenType.COMMA):
+            while types[self.position] is TT_COMMA:
                 self.advance()
                 elements.append(self.expression())
         
-        self.consume(TokenType.RIGHT_BRACKET)
-        return Literal(elements, DataType.DATA)  # Array literal
+        self.consume(TT_RIGHT_BRACKET)
+        return Literal(elements, DT_DATA)  # Array literal
     
     def struct_literal(self) -> Expression:
         """
         struct_literal -> '{' (IDENTIFIER '=' expression (',' IDENTIFIER '=' expression)*)? '}'
         """
-        self.consume(TokenType.LEFT_BRACE)
+        types = self.types
+        self.consume(TT_LEFT_BRACE)
         members = {}
         
-        if not self.expect(TokenType.RIGHT_BRACE):
-            name = self.consume(TokenType.IDENTIFIER).value
-            self.consume(TokenType.ASSIGN)
+        if self.current_token.type is not TT_RIGHT_BRACE:
+            name = self.consume(TT_IDENTIFIER).value
+            self.consume(TT_ASSIGN)
             value = self.statement()
             members[name] = value
             
-            while self.expect(TokenType.COMMA):
+            while types[self.position] is TT_COMMA:
                 self.advance()
-                name = self.consume(TokenType.IDENTIFIER).value
-                self.consume(TokenType.ASSIGN)
+                name = self.consume(TT_IDENTIFIER).value
+                self.consume(TT_ASSIGN)
                 value = self.expression()
                 members[name] = value
         
-        self.consume(TokenType.RIGHT_BRACE)
-        return Literal(members, DataType.DATA)  # Struct literal
-
-    def struct_body_item(self):
-            if self.expect(TokenType.PUBLIC):
-                self.advance()
-                self.consume(TokenType.LEFT_BRACE)
-                while not self.expect(TokenType.RIGHT_BRACE):
-                    self.parse_object_body_item(methods, members, nested_objects, nested_structs, is_private=False)
-                self.consume(TokenType.RIGHT_BRACE)
-                self.consume(TokenType.SEMICOLON)
-            elif self.expect(TokenType.PRIVATE):
-                self.advance()
-                self.consume(TokenType.LEFT_BRACE)
-                while not self.expect(TokenType.RIGHT_BRACE):
-                    self.parse_object_body_item(methods, members, nested_objects, nested_structs, is_private=True)
-                self.consume(TokenType.RIGHT_BRACE)
-                self.consume(TokenType.SEMICOLON)
+        self.consume(TT_RIGHT_BRACE)
+        return Literal(members, DT_DATA)  # Struct literal
 
     def destructuring_assignment(self) -> DestructuringAssignment:
         """
         destructuring_assignment -> 'auto' '{' destructure_vars '}' '=' expression ('from' IDENTIFIER)?
         """
-        self.consume(TokenType.AUTO)
-        self.consume(TokenType.LEFT_BRACE)
+        types = self.types
+        self.consume(TT_AUTO)
+        self.consume(TT_LEFT_BRACE)
         
         # Parse variables in destructuring pattern
         variables = []
-        while not self.expect(TokenType.RIGHT_BRACE):
-            if self.expect(TokenType.IDENTIFIER):
-                name = self.consume(TokenType.IDENTIFIER).value
-                if self.expect(TokenType.AS):
-                    self.advance()
-                    type_spec = self.type_spec()
-                    variables.append((name, type_spec))
-                else:
-                    variables.append(name)
+        # One look at the token after each variable: ',' continues the list,
+        # anything else must be the closing brace
+        while types[self.position] not in BLOCK_END_TOKENS:
+            name = self.consume(TT_IDENTIFIER).value
+            if self.current_token.type is TT_AS:
+                self.advance()
+                type_spec = self.type_spec()
+                variables.append((name, type_spec))
+            else:
+                variables.append(name)
             
-            if not self.expect(TokenType.RIGHT_BRACE):
-                self.consume(TokenType.COMMA)
+            if types[self.position] is not TT_COMMA:
+                break
+            self.advance()
         
-        self.consume(TokenType.RIGHT_BRACE)
-        self.consume(TokenType.ASSIGN)
+        self.consume(TT_RIGHT_BRACE)
+        self.consume(TT_ASSIGN)
         source = self.expression()
         
         # Optional 'from' clause
         source_type = None
-        if self.expect(TokenType.FROM):
+        if self.current_token.type is TT_FROM:
             self.advance()
-            source_type = Identifier(self.consume(TokenType.IDENTIFIER).value)
+            source_type = Identifier(self.consume(TT_IDENTIFIER).value)
         
         is_explicit = any(isinstance(var, tuple) for var in variables)
         return DestructuringAssignment(variables, source, source_type, is_explicit)
 
+# Statements selected by their leading keyword; anything else falls through
+# to the declaration / expression checks at the end of FluxParser.statement
+STATEMENT_RULES = {
+    TT_IMPORT: FluxParser.import_statement,
+    TT_USING: FluxParser.using_statement,
+    TT_DEF: FluxParser.function_def,
+    TT_UNION: FluxParser.union_def,
+    TT_STRUCT: FluxParser.struct_def,
+    TT_OBJECT: FluxParser.object_def,
+    TT_NAMESPACE: FluxParser.namespace_def,
+    TT_IF: FluxParser.if_statement,
+    TT_WHILE: FluxParser.while_statement,
+    TT_FOR: FluxParser.for_statement,
+    TT_DO: FluxParser.do_while_statement,
+    TT_SWITCH: FluxParser.switch_statement,
+    TT_TRY: FluxParser.try_statement,
+    TT_RETURN: FluxParser.return_statement,
+    TT_BREAK: FluxParser.break_statement,
+    TT_CONTINUE: FluxParser.continue_statement,
+    TT_THROW: FluxParser.throw_statement,
+    TT_ASSERT: FluxParser.assert_statement,
+    TT_LEFT_BRACE: FluxParser.block_statement,
+    TT_SEMICOLON: FluxParser.empty_statement,
+    TT_AUTO: FluxParser.auto_statement,
+    TT_ASM: FluxParser.asm_statement,
+}
+
+# Token type -> rule for every primary expression other than a plain identifier
+PRIMARY_RULES = {
+    TT_XOR: FluxParser.xor_call,
+    TT_INTEGER: FluxParser.integer_literal,
+    TT_FLOAT: FluxParser.float_literal,
+    TT_CHAR: FluxParser.char_literal,
+    TT_STRING_LITERAL: FluxParser.char_literal,
+    TT_TRUE: FluxParser.true_literal,
+    TT_FALSE: FluxParser.false_literal,
+    TT_VOID: FluxParser.void_literal,
+    TT_THIS: FluxParser.keyword_identifier,
+    TT_SUPER: FluxParser.keyword_identifier,
+    TT_LEFT_PAREN: FluxParser.parenthesized_expression,
+    TT_LEFT_BRACKET: FluxParser.array_literal,
+    TT_LEFT_BRACE: FluxParser.struct_literal,
+    TT_SIZEOF: FluxParser.sizeof_expression,
+    TT_ALIGNOF: FluxParser.alignof_expression,
+}
+
 # Add main function for testing
 def main():
     """Main function for testing the parser"""
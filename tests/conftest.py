@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The compiler modules import each other by bare name (flexer, fparser, fast)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src" / "compiler"))
@@ -0,0 +1,108 @@
+"""The AST cache must never turn a valid program into a failed build"""
+
+import os
+import pickle
+import shutil
+import sys
+
+import pytest
+
+import fc
+from fc import FluxCompiler
+
+# Deep enough that pickling the BinaryOp chain exceeds the recursion limit
+DEEP_PROGRAM = "def main() -> int { int x = " + " + ".join(["1"] * 12000) + "; return 0; };\n"
+
+
+@pytest.fixture
+def compiler(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    compiler = FluxCompiler()
+    compiler.cache_dir = tmp_path / "cache"
+    return compiler
+
+
+def test_unpicklable_ast_is_left_uncached(compiler, tmp_path):
+    source = tmp_path / "deep.fx"
+    source.write_text(DEEP_PROGRAM)
+    ast = compiler.load_ast(str(source), show_tokens=False)
+    assert len(ast.statements) == 1
+    assert list(compiler.cache_dir.glob("*.ast.pkl")) == []
+
+
+def test_shallow_ast_is_cached(compiler, tmp_path):
+    source = tmp_path / "main.fx"
+    source.write_text("def main() -> int { return 0; };\n")
+    first = compiler.load_ast(str(source), show_tokens=False)
+    assert len(list(compiler.cache_dir.glob("*.ast.pkl"))) == 1
+    assert compiler.load_ast(str(source), show_tokens=False) == first
+
+
+@pytest.mark.parametrize("payload", [
+    b"",
+    pickle.dumps(list(range(100)))[:20],
+    b"\x80\x05not a pickle",
+    b"cno_such_flux_module\nProgram\n.",
+    b"cbuiltins\nint\n(S'x'\ntR.",
+], ids=["empty", "truncated", "corrupt", "missing-module", "value-error"])
+def test_unreadable_cache_entry_is_a_miss(compiler, tmp_path, payload):
+    source = tmp_path / "main.fx"
+    source.write_text("def main() -> int { return 0; };\n")
+    expected = compiler.load_ast(str(source), show_tokens=False)
+    [entry] = compiler.cache_dir.glob("*.ast.pkl")
+    entry.write_bytes(payload)
+    assert compiler.load_ast(str(source), show_tokens=False) == expected
+
+
+def test_interrupted_write_leaves_no_entry(compiler, tmp_path, monkeypatch):
+    source = tmp_path / "main.fx"
+    source.write_text("def main() -> int { return 0; };\n")
+
+    def write_file(path, data):
+        path.write_bytes(data[:10])
+        raise OSError("disk full")
+
+    monkeypatch.setattr(compiler, "write_file", write_file)
+    compiler.load_ast(str(source), show_tokens=False)
+    assert list(compiler.cache_dir.iterdir()) == []
+
+
+def test_cache_is_pruned_least_recently_used_first(compiler, tmp_path, monkeypatch):
+    sources = []
+    for i in range(3):
+        source = tmp_path / f"main{i}.fx"
+        source.write_text(f"def main() -> int {{ return {i}; }};\n")
+        sources.append(source)
+    compiler.load_ast(str(sources[0]), show_tokens=False)
+    [first] = compiler.cache_dir.glob("*.ast.pkl")
+    compiler.load_ast(str(sources[1]), show_tokens=False)
+    [second] = set(compiler.cache_dir.glob("*.ast.pkl")) - {first}
+    # Age both entries, then use the first again so the second is the oldest
+    for entry in (first, second):
+        os.utime(entry, ns=(0, 0))
+    compiler.load_ast(str(sources[0]), show_tokens=False)
+
+    monkeypatch.setattr(fc, "CACHE_MAX_BYTES", first.stat().st_size * 2)
+    compiler.load_ast(str(sources[2]), show_tokens=False)
+    entries = set(compiler.cache_dir.glob("*.ast.pkl"))
+    assert first in entries and second not in entries and len(entries) == 2
+
+
+@pytest.fixture
+def compiler_recursion_limit():
+    # Code generation recurses once per BinaryOp; fc.main() raises the limit the same way
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(max(limit, fc.RECURSION_LIMIT))
+    yield
+    sys.setrecursionlimit(limit)
+
+
+@pytest.mark.skipif(not all(shutil.which(tool) for tool in ("llc", "as", "gcc")),
+                    reason="needs the LLVM and GNU toolchain")
+@pytest.mark.usefixtures("compiler_recursion_limit")
+def test_deep_expression_compiles_with_cache(compiler, tmp_path):
+    source = tmp_path / "deep.fx"
+    source.write_text(DEEP_PROGRAM)
+    output = compiler.compile_file(str(source), str(tmp_path / "deep"))
+    assert (tmp_path / "deep").exists()
+    assert output == str(tmp_path / "deep")
@@ -0,0 +1,59 @@
+"""Command line behaviour of fc.py"""
+
+import sys
+
+import pytest
+
+import fc
+from flexer import FluxLexer
+from fparser import FluxParser
+
+
+def run_main(monkeypatch, *argv):
+    monkeypatch.setattr(sys, "argv", ["fc.py", *argv])
+    fc.main()
+
+
+def test_parse_only_goes_through_ast_cache(tmp_path, monkeypatch, capsys):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    source = tmp_path / "main.fx"
+    source.write_text("def main() -> int { return 0; };\n")
+    run_main(monkeypatch, "-o", str(source))
+    assert "FunctionDef(name='main'" in capsys.readouterr().out
+    assert len(list((tmp_path / ".flux_cache").glob("*.ast.pkl"))) == 1
+
+
+def test_parse_only_reports_missing_file(tmp_path, monkeypatch, capsys):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    with pytest.raises(SystemExit) as exit_info:
+        run_main(monkeypatch, "-o", str(tmp_path / "missing.fx"))
+    assert exit_info.value.code == 1
+    assert "Compilation failed" in capsys.readouterr().err
+
+
+def test_only_main_raises_recursion_limit(tmp_path, monkeypatch, capsys):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    limit = sys.getrecursionlimit()
+    try:
+        FluxParser(FluxLexer("x = (((1)));").tokenize()).parse()
+        assert sys.getrecursionlimit() == limit
+        source = tmp_path / "main.fx"
+        source.write_text("def main() -> int { return 0; };\n")
+        run_main(monkeypatch, "-o", str(source))
+        assert sys.getrecursionlimit() == max(limit, fc.RECURSION_LIMIT)
+    finally:
+        sys.setrecursionlimit(limit)
+
+
+@pytest.mark.parametrize("argv, cpu", [((), "generic"), (("--mcpu=native",), "native")])
+def test_target_cpu_is_generic_unless_requested(tmp_path, monkeypatch, argv, cpu):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    limit = sys.getrecursionlimit()
+    targets = []
+    monkeypatch.setattr(fc.FluxCompiler, "compile_file",
+                        lambda self, filename, output_bin=None: targets.append(self.cpu) or "./main")
+    try:
+        run_main(monkeypatch, *argv, str(tmp_path / "main.fx"))
+    finally:
+        sys.setrecursionlimit(limit)
+    assert targets == [cpu]
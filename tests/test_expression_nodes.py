@@ -0,0 +1,53 @@
+"""Pass-through expression productions return their operand, not a wrapper node"""
+
+import pytest
+
+from flexer import FluxLexer
+from fast import Assignment, CastExpression, ExpressionStatement, Identifier, Literal
+from fparser import FluxParser
+
+# Every rule between expression() and primary_expression(), called with the
+# arguments the precedence chain uses
+EXPRESSION_RULES = [
+    ("expression", ()),
+    ("binary_expression", (1,)),
+    ("cast_expression", ()),
+    ("unary_expression", ()),
+    ("postfix_expression", ()),
+    ("primary_expression", ()),
+]
+
+
+def parser_for(source):
+    return FluxParser(FluxLexer(source).tokenize())
+
+
+@pytest.mark.parametrize("rule, args", EXPRESSION_RULES)
+@pytest.mark.parametrize("source, node_type", [
+    ("a", Identifier),
+    ("(a)", Identifier),
+    ("1", Literal),
+    ("((1))", Literal),
+])
+def test_single_operand_is_returned_unwrapped(rule, args, source, node_type):
+    parser = parser_for(source)
+    node = getattr(parser, rule)(*args)
+    assert type(node) is node_type
+    assert parser.errors == []
+
+
+def statement_expressions(source):
+    parser = parser_for(source)
+    program = parser.parse()
+    assert parser.errors == []
+    assert all(type(stmt) is ExpressionStatement for stmt in program.statements)
+    return [stmt.expression for stmt in program.statements]
+
+
+def test_statement_operands_are_unwrapped():
+    plain, parenthesised, cast, assignment = statement_expressions("a; (a); (int)a; a = b;")
+    assert plain == Identifier("a") and type(plain) is Identifier
+    assert parenthesised == Identifier("a") and type(parenthesised) is Identifier
+    assert type(cast) is CastExpression and type(cast.expression) is Identifier
+    assert type(assignment) is Assignment
+    assert type(assignment.target) is Identifier and type(assignment.value) is Identifier
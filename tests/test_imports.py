@@ -0,0 +1,23 @@
+"""Compiling leaves ImportStatement's class-wide state as it found it"""
+
+from fast import ImportStatement
+from fc import FluxCompiler
+
+
+def test_compile_restores_import_state(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "lib.fx").write_text("def helper() -> int { return 1; };\n")
+    (tmp_path / "app.fx").write_text('import "lib.fx";\ndef main() -> int { return helper(); };\n')
+    compiler = FluxCompiler(use_cache=False)
+    monkeypatch.setattr(compiler, "run_tool", lambda args: None)
+
+    imports = ImportStatement._processed_imports
+    loader = ImportStatement._ast_loader
+    compiler.compile_file(str(tmp_path / "app.fx"))
+
+    # The build went through this compiler's loader...
+    assert list(compiler.imported_files) == [(tmp_path / "lib.fx").resolve()]
+    # ...and left no trace of it for the next user of fast
+    assert ImportStatement._processed_imports is imports
+    assert str((tmp_path / "lib.fx").resolve()) not in imports
+    assert ImportStatement._ast_loader is loader
@@ -0,0 +1,52 @@
+"""Packrat memoization must not change what the parser builds"""
+
+from pathlib import Path
+
+import pytest
+
+from flexer import FluxLexer
+from fparser import FluxParser
+
+REPO = Path(__file__).resolve().parent.parent
+SOURCES = sorted(REPO.glob("examples/*.fx")) + sorted(REPO.glob("src/stdlib/*.fx"))
+
+# Failed cast guesses, whose fallback re-enters expression() at the same positions
+BACKTRACKING = [
+    "def main() -> int { x = (a)++; };",
+    "def main() -> int { x = (a)(b) + (c)(d, (e)(f)); };",
+    "def main() -> int { x = " + "(a)(" * 12 + "b" + ")" * 12 + "; };",
+    "def main() -> int { x = " + "(a)(" * 12 + "b +" + ")" * 12 + "; };",
+]
+
+
+class UnmemoizedParser(FluxParser):
+    """Never memoizes, even after a failed cast guess"""
+    __slots__ = ()
+    memo = property(lambda self: None, lambda self, value: None)
+
+
+def parse(source, memoize):
+    tokens = FluxLexer(source).tokenize()
+    parser = FluxParser(tokens, memoize=True) if memoize else UnmemoizedParser(tokens)
+    program = parser.parse()
+    return program, [str(error) for error in parser.errors]
+
+
+@pytest.mark.parametrize("path", SOURCES, ids=lambda path: path.name)
+def test_memoized_ast_matches_plain_parse(path):
+    source = path.read_text()
+    assert parse(source, memoize=True) == parse(source, memoize=False)
+
+
+@pytest.mark.parametrize("source", BACKTRACKING)
+def test_memoized_ast_matches_after_backtracking(source):
+    assert parse(source, memoize=True) == parse(source, memoize=False)
+
+
+def test_memo_is_only_allocated_once_needed():
+    parser = FluxParser(FluxLexer("def main() -> int { x = (int)a + b; };").tokenize())
+    parser.parse()
+    assert parser.memo is None
+    parser = FluxParser(FluxLexer(BACKTRACKING[0]).tokenize())
+    parser.parse()
+    assert parser.memo is not None
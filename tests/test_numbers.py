@@ -0,0 +1,48 @@
+"""Integer literals the lexer cannot convert must surface as parse errors"""
+
+import pytest
+
+from flexer import FluxLexer, TokenType
+from fparser import FluxParser, ParseError
+
+
+def parse(source):
+    parser = FluxParser(FluxLexer(source).tokenize())
+    program = parser.parse()
+    return program, parser.errors
+
+
+@pytest.mark.parametrize("text", ["010", "09", "0x", "0b"])
+def test_unconvertible_integer_lexes_without_value(text):
+    token = FluxLexer(text).tokenize()[0]
+    assert token.type is TokenType.INTEGER
+    assert token.value == text
+    assert token.number is None
+
+
+@pytest.mark.parametrize("source", [
+    "int x = 010;",
+    "int x = 09;",
+    "int x = 0x;",
+    "int x = 0b;",
+    "int[09] a;",
+    "data{0x} a;",
+    "data{8:0b} a;",
+])
+def test_unconvertible_integer_is_parse_error(source):
+    _, errors = parse(source)
+    assert len(errors) == 1
+    assert isinstance(errors[0], ParseError)
+    assert "Invalid integer literal" in errors[0].message
+
+
+def test_asm_label_reference_is_kept_verbatim():
+    program, errors = parse("asm { 0: dec ecx; jnz 0b };")
+    assert errors == []
+    assert program.statements[0].expression.body == "0 : dec ecx ; jnz 0b"
+
+
+def test_valid_integers_convert():
+    _, errors = parse("int x = 0x1F + 0b101 + 0 + 42;")
+    assert errors == []
+    assert [token.number for token in FluxLexer("0x1F 0b101 0 42").tokenize()[:4]] == [31, 5, 0, 42]
@@ -0,0 +1,33 @@
+"""Error recovery resumes without cascading errors"""
+
+from flexer import FluxLexer
+from fast import FunctionDef
+from fparser import FluxParser
+
+
+def parse(source):
+    parser = FluxParser(FluxLexer(source).tokenize())
+    program = parser.parse()
+    names = [stmt.name for stmt in program.statements if isinstance(stmt, FunctionDef)]
+    return names, [error.message for error in parser.errors]
+
+
+def test_resumes_at_keyword_on_the_same_level():
+    names, errors = parse("int x = 1 +\ndef g() -> int { return 2; };")
+    assert names == ["g"]
+    assert len(errors) == 1
+
+
+def test_does_not_resume_at_keyword_nested_in_failed_statement():
+    # The 'while' belongs to f's body; resuming there would parse 'b += 1;' and
+    # f's closing brace as top-level statements and report both
+    names, errors = parse(
+        "def f() -> void {\n"
+        "    int x = (\n"
+        "    while (a) { b += 1; };\n"
+        "};\n"
+        "def g() -> int { return 2; };"
+    )
+    assert names == ["g"]
+    assert errors == ["Unexpected token: WHILE", "Unexpected token: RIGHT_BRACE",
+                      "Unexpected token: RIGHT_BRACE"]
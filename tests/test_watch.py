@@ -0,0 +1,64 @@
+"""--watch rebuilds entry files when they or their imports change"""
+
+import os
+
+import pytest
+
+import fc
+from fc import FluxCompiler
+
+LIB = "def helper() -> int { return 1; };\n"
+APP = 'import "lib.fx";\ndef main() -> int { return helper(); };\n'
+
+
+def touch(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "lib.fx").write_text(LIB)
+    (tmp_path / "app.fx").write_text(APP)
+    return tmp_path
+
+
+def run_watch(monkeypatch, path, edits):
+    """
+    Run FluxCompiler.watch for one poll per entry in edits, applying each edit
+    between polls, and return the sources that were linked on each poll.
+    """
+    compiler = FluxCompiler(use_cache=False)
+    polls = [[]]
+
+    def run_tool(args):
+        # Record the linked binary instead of running the toolchain
+        if args[0] == "gcc":
+            polls[-1].append(os.path.basename(args[-1]))
+
+    def sleep(interval):
+        if len(polls) > len(edits):
+            raise KeyboardInterrupt
+        edits[len(polls) - 1]()
+        polls.append([])
+
+    monkeypatch.setattr(compiler, "run_tool", run_tool)
+    monkeypatch.setattr(fc.time, "sleep", sleep)
+    compiler.watch(str(path))
+    return polls
+
+
+def test_directory_links_only_entry_files(project, monkeypatch):
+    polls = run_watch(monkeypatch, project, [lambda: None])
+    assert polls == [["app"], []]
+
+
+def test_editing_import_rebuilds_importer(project, monkeypatch):
+    polls = run_watch(monkeypatch, project, [lambda: touch(project / "lib.fx"), lambda: None])
+    assert polls == [["app"], ["app"], []]
+
+
+def test_single_file_rebuilds_on_import_change(project, monkeypatch):
+    polls = run_watch(monkeypatch, project / "app.fx", [lambda: None, lambda: touch(project / "lib.fx")])
+    assert polls == [["app"], [], ["app"]]